@@ -0,0 +1,45 @@
+# app_aggregation/api/middleware.py
+"""
+ASGI middleware for request-level checks that must run before the body is read.
+"""
+
+import logging
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Allowance for the SRT part and multipart framing on top of the video size limit
+UPLOAD_BODY_OVERHEAD = 1024 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject requests whose declared Content-Length exceeds the limit with HTTP 413.
+
+    FastAPI parses (and spools) multipart forms before the endpoint runs, so a
+    size check inside the route only happens after the whole upload was received.
+    Checking the header here rejects oversized uploads before any byte is read.
+    Chunked uploads without Content-Length are still limited while streaming to disk.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_body_size:
+                        logger.warning("Rejected request to %s: Content-Length %s exceeds limit", scope['path'], int(value))
+                        response = JSONResponse(
+                            {"detail": "File size exceeds maximum allowed size"},
+                            status_code=413
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+
+        await self.app(scope, receive, send)
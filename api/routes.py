@@ -4,26 +4,181 @@ API route definitions for video processing endpoints.
 UPDATED: Now accepts detected_language and animals_detected from vidp-fastapi-service
 """
 
+import asyncio
+import base64
+import binascii
+import io
 import logging
+import os
+import re
 from pathlib import Path
-from typing import Optional
-import uuid
-import json
+from types import MappingProxyType
+from typing import Optional, List
+import secrets
+import time
+from email.utils import format_datetime
 
-from fastapi import APIRouter, UploadFile, File, Form, BackgroundTasks, HTTPException, status, Request
-from fastapi.responses import StreamingResponse, RedirectResponse
+import aiofiles
+import orjson
+from fastapi import APIRouter, UploadFile, File, Form, BackgroundTasks, HTTPException, status, Request, Query
+from fastapi.responses import Response, StreamingResponse, RedirectResponse, ORJSONResponse
+from starlette.formparsers import MultiPartParser
 
 from config.settings import settings
 from services.ffmpeg_service import FFmpegService
 from services.dynamodb_service import DynamoDBService
 from services.s3_service import S3Service
-from models.video import VideoStatus, VideoCreateRequest, VideoUpdateRequest
-from utils.file_utils import cleanup_files, validate_file_size
+from models.video import VIDEO_METADATA_EXAMPLE, VideoMetadata, VideoStatus, VideoCreateRequest, VideoUpdateRequest, VideoBatchRequest
+from utils.file_utils import cleanup_files, cleanup_files_async
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["Video Processing"])
 
+# Resolution mapping (width, height)
+RESOLUTION_MAP = MappingProxyType({
+    "1080p": (1920, 1080),
+    "720p": (1280, 720),
+    "480p": (854, 480),
+    "360p": (640, 360)
+})
+
+# Bounds concurrent FFmpeg encodes so they do not contend for encoder sessions/VRAM
+_transcode_sem = asyncio.Semaphore(settings.MAX_CONCURRENT_TRANSCODES)
+
+# Single byte range, e.g. "bytes=0-1023" or "bytes=1024-"
+RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+def _spooled_upload_fileno(upload: UploadFile) -> Optional[int]:
+    """
+    Get the file descriptor of an upload Starlette spooled to a temporary file.
+    
+    Uploads up to MultiPartParser.spool_max_size stay in memory, and asking those
+    for fileno() would force them to disk, so they (and uploads not backed by a
+    real file) return None.
+    """
+    if upload.size is None or upload.size <= MultiPartParser.spool_max_size:
+        return None
+    try:
+        return upload.file.fileno()
+    except (OSError, io.UnsupportedOperation):
+        return None
+
+
+def _copy_spooled_upload(src_fd: int, destination: Path, max_size: Optional[int] = None) -> int:
+    """
+    Copy an upload that was spooled to a temporary file with sendfile (in-kernel, no
+    user-space buffers). Runs in a worker thread.
+    
+    Args:
+        src_fd: File descriptor of the spooled upload.
+        destination: Local path to write to.
+        max_size: Optional size limit in bytes; exceeding it aborts with HTTP 413.
+        
+    Returns:
+        int: Number of bytes written.
+    """
+    size = os.fstat(src_fd).st_size
+    if max_size is not None and size > max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="File size exceeds maximum allowed size"
+        )
+    
+    with open(destination, "wb") as buffer:
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(buffer.fileno(), src_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    return offset
+
+
+async def _save_upload(upload: UploadFile, destination: Path, max_size: Optional[int] = None) -> int:
+    """
+    Stream an uploaded file to disk chunk by chunk.
+    
+    Uploads that Starlette already spooled to disk are copied with sendfile instead.
+    
+    Args:
+        upload: Incoming multipart file.
+        destination: Local path to write to.
+        max_size: Optional size limit in bytes; exceeding it aborts with HTTP 413.
+        
+    Returns:
+        int: Number of bytes written.
+    """
+    src_fd = _spooled_upload_fileno(upload) if hasattr(os, "sendfile") else None
+    if src_fd is not None:
+        return await asyncio.to_thread(_copy_spooled_upload, src_fd, destination, max_size)
+    
+    written = 0
+    async with aiofiles.open(destination, "wb") as buffer:
+        while chunk := await upload.read(settings.CHUNK_SIZE):
+            written += len(chunk)
+            if max_size is not None and written > max_size:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail="File size exceeds maximum allowed size"
+                )
+            await buffer.write(chunk)
+    return written
+
+
+def _encode_cursor(last_key: Optional[dict]) -> Optional[str]:
+    """Turn a DynamoDB LastEvaluatedKey into an opaque URL-safe cursor."""
+    if not last_key:
+        return None
+    return base64.urlsafe_b64encode(orjson.dumps(last_key)).decode()
+
+
+def _decode_cursor(cursor: str) -> dict:
+    """Decode a cursor produced by _encode_cursor, rejecting malformed values with HTTP 400."""
+    try:
+        last_key = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, orjson.JSONDecodeError):
+        last_key = None
+    # Key attributes are in DynamoDB wire format, e.g. {"videoId": {"S": "..."}}
+    if not isinstance(last_key, dict) or not all(isinstance(value, dict) for value in last_key.values()):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return last_key
+
+
+def _parse_fields(fields: str) -> List[str]:
+    """Parse a comma-separated list of VideoMetadata field names, rejecting unknown ones with HTTP 400."""
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    names = ["videoId" if name == "id" else name for name in names]
+    unknown = [name for name in names if name not in VideoMetadata.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    return names
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Check an If-None-Match header (weak comparison, list or '*') against an ETag."""
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+async def _refresh_links(videos: List[VideoMetadata]) -> None:
+    """Replace the stored links of the given videos with fresh presigned URLs, signed in one batch."""
+    try:
+        urls = await S3Service.get_presigned_urls([video.s3_key for video in videos if video.s3_key])
+    except Exception as e:
+        logger.warning("Failed to generate presigned URLs: %s", e)
+        return
+    
+    for video in videos:
+        if video.s3_key in urls:
+            video.link = urls[video.s3_key]
+
 
 @router.post(
     "/process-video/",
@@ -40,7 +195,8 @@ async def process_video(
     source_video_id: Optional[str] = Form(default=None, description="Video ID from the main service (vidp-fastapi-service)"),
     original_filename: Optional[str] = Form(default=None, description="Original filename uploaded by user"),
     detected_language: Optional[str] = Form(default=None, description="Language detected by language detection service (ISO code)"),
-    animals_detected: Optional[str] = Form(default=None, description="Animals detected by YOLO service (JSON string)")
+    animals_detected: Optional[str] = Form(default=None, description="Animals detected by YOLO service (JSON string)"),
+    extra_resolutions: Optional[str] = Form(default=None, description="Additional resolutions encoded in the same pass, comma-separated (e.g. '720p,480p')")
 ) -> dict:
     """
     Process video with provided SRT subtitles, burn them in, compress, and store to S3.
@@ -48,32 +204,33 @@ async def process_video(
     NEW: Also receives and stores original_filename, detected_language and animals_detected metadata.
     
     Steps:
-    1. Save uploaded video and SRT file locally (temp)
+    1. Save uploaded video and SRT file locally (temp) while creating the DynamoDB entry
     2. Burn subtitles into video using FFmpeg
     3. Upload final video to S3
     4. Save metadata to DynamoDB (including original filename, language and animals)
     5. Return streaming URL (presigned S3 URL)
     """
     # Generate a unique Job ID
-    job_id = f"job_{uuid.uuid4().hex[:8]}"
-    logger.info(f"[{job_id}] Starting video processing for: {video.filename}")
+    # Millisecond timestamp prefix (sorts by creation time) + 64 random bits
+    job_id = f"job_{time.time_ns() // 1_000_000:012x}{secrets.token_hex(8)}"
+    logger.info("[%s] Starting video processing for: %s", job_id, video.filename)
     
     # Use original_filename if provided, otherwise use uploaded filename
     final_original_filename = original_filename if original_filename else video.filename
-    logger.info(f"[{job_id}] Original filename: {final_original_filename}")
+    logger.info("[%s] Original filename: %s", job_id, final_original_filename)
     
     # Parse animals_detected if provided
     animals_dict = None
     if animals_detected:
         try:
-            animals_dict = json.loads(animals_detected)
-            logger.info(f"[{job_id}] Animals detected: {animals_dict}")
-        except json.JSONDecodeError as e:
-            logger.warning(f"[{job_id}] Failed to parse animals_detected JSON: {e}")
+            animals_dict = orjson.loads(animals_detected)
+            logger.info("[%s] Animals detected: %s", job_id, animals_dict)
+        except orjson.JSONDecodeError as e:
+            logger.warning("[%s] Failed to parse animals_detected JSON: %s", job_id, e)
     
     # Log detected language
     if detected_language:
-        logger.info(f"[{job_id}] Detected language: {detected_language}")
+        logger.info("[%s] Detected language: %s", job_id, detected_language)
     
     # Define file paths (local temp)
     original_video_path = settings.TEMP_DIR / f"{job_id}_original.mp4"
@@ -87,53 +244,36 @@ async def process_video(
     # Track temporary files for cleanup
     temp_files = [original_video_path, srt_path, burned_video_path]
     
-    # Resolution mapping
-    resolution_map = {
-        "1080p": "1920x1080",
-        "720p": "1280x720",
-        "480p": "854x480",
-        "360p": "640x360"
-    }
-    target_resolution = resolution_map.get(resolution, "640x360")
+    target_resolution = RESOLUTION_MAP.get(resolution, (640, 360))
+    
+    # Additional renditions: label -> (resolution, local path, S3 key)
+    renditions = {}
+    for label in (extra_resolutions or "").split(","):
+        label = label.strip()
+        if not label:
+            continue
+        if label not in RESOLUTION_MAP:
+            logger.warning("[%s] Ignoring unknown extra resolution: %s", job_id, label)
+        elif RESOLUTION_MAP[label] != target_resolution and label not in renditions:
+            renditions[label] = (
+                RESOLUTION_MAP[label],
+                settings.TEMP_DIR / f"{job_id}_{label}.mp4",
+                f"{job_id}_{label}.mp4"
+            )
+    temp_files.extend(path for _, path, _ in renditions.values())
     
     video_id = None
     
     try:
-        # Step 1: Save uploaded video
-        logger.info(f"[{job_id}] Saving uploaded video: {video.filename}")
-        settings.TEMP_DIR.mkdir(parents=True, exist_ok=True)
-        
-        video_content = await video.read()
-        with open(original_video_path, "wb") as buffer:
-            buffer.write(video_content)
-        
-        if hasattr(settings, 'MAX_UPLOAD_SIZE') and not validate_file_size(original_video_path, settings.MAX_UPLOAD_SIZE):
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File size exceeds maximum allowed size"
-            )
+        # Steps 1-3: Save uploaded video and SRT file and create the initial
+        # DynamoDB entry concurrently (file_size is filled in by the final update)
+        logger.info("[%s] Saving uploaded video: %s", job_id, video.filename)
+        logger.info("[%s] Saving uploaded SRT file: %s", job_id, srt_file.filename)
         
-        # Step 2: Save uploaded SRT file
-        logger.info(f"[{job_id}] Saving uploaded SRT file: {srt_file.filename}")
-        
-        srt_content = await srt_file.read()
-        logger.info(f"[{job_id}] SRT content size: {len(srt_content)} bytes")
-        
-        has_subtitles = len(srt_content) > 0
-        if not has_subtitles:
-            logger.info(f"[{job_id}] SRT file is empty - will process video without subtitles")
-        
-        with open(srt_path, "wb") as buffer:
-            buffer.write(srt_content)
-        
-        if has_subtitles:
-            logger.info(f"[{job_id}] SRT file written, size on disk: {srt_path.stat().st_size} bytes")
-
-        # Step 3: Create initial DynamoDB entry
-        streaming_url = f"{settings.API_URL}/api/stream/{final_filename}"
+        streaming_url = f"{settings.api_url}/api/stream/{final_filename}"
         
         if source_video_id:
-            logger.info(f"[{job_id}] Linking to source video ID: {source_video_id}")
+            logger.info("[%s] Linking to source video ID: %s", job_id, source_video_id)
         
         video_create = VideoCreateRequest(
             filename=final_original_filename,  # Use the original filename from user
@@ -141,37 +281,68 @@ async def process_video(
             s3_key=s3_key,
             link=streaming_url,
             status=VideoStatus.PROCESSING,
-            file_size=original_video_path.stat().st_size,
             source_video_id=source_video_id
         )
         
-        video_metadata = await DynamoDBService.create_video(video_create)
-        video_id = str(video_metadata.id)
+        results = await asyncio.gather(
+            _save_upload(video, original_video_path, settings.MAX_UPLOAD_SIZE),
+            _save_upload(srt_file, srt_path),
+            DynamoDBService.create_video(video_create),
+            return_exceptions=True
+        )
+        video_size, srt_size, video_metadata = results
         
-        # Step 4: Burn subtitles into video
-        logger.info(f"[{job_id}] Burning subtitles into video")
+        # Keep the ID even if a save failed so the entry can be removed or marked as FAILED
+        if not isinstance(video_metadata, BaseException):
+            video_id = str(video_metadata.id)
         
-        await FFmpegService.burn_subtitles(
-            video_path=str(original_video_path),
-            srt_path=str(srt_path),
-            output_path=str(burned_video_path),
-            resolution=target_resolution,
-            crf=crf_value
-        )
+        for result in results:
+            if isinstance(result, BaseException):
+                if isinstance(result, HTTPException) and video_id:
+                    # A rejected upload (e.g. 413) leaves no record behind
+                    try:
+                        await DynamoDBService.delete_video(video_id)
+                        video_id = None
+                    except Exception as e:
+                        logger.warning("[%s] Failed to delete entry of rejected upload: %s", job_id, e)
+                raise result
         
-        # Step 5: Upload to S3
-        logger.info(f"[{job_id}] Uploading final video to S3")
-        s3_uri = await S3Service.upload_file(
-            local_path=burned_video_path,
-            s3_key=s3_key,
-            content_type="video/mp4"
-        )
+        logger.info("[%s] Video saved: %s bytes", job_id, video_size)
+        logger.info("[%s] SRT content size: %s bytes", job_id, srt_size)
         
-        # Step 6: Get final video information
-        video_info = FFmpegService.get_video_metadata(str(burned_video_path))
+        has_subtitles = srt_size > 0
+        if not has_subtitles:
+            logger.info("[%s] SRT file is empty - will process video without subtitles", job_id)
         
-        # Step 7: Generate presigned URL for streaming
-        presigned_url = await S3Service.get_presigned_url(s3_key)
+        # Step 4: Burn subtitles into video
+        logger.info("[%s] Burning subtitles into video", job_id)
+        
+        async with _transcode_sem:
+            await FFmpegService.burn_subtitles(
+                video_path=str(original_video_path),
+                srt_path=str(srt_path) if has_subtitles else None,
+                output_path=str(burned_video_path),
+                resolution=target_resolution,
+                crf=crf_value,
+                extra_outputs=[(size, str(path)) for size, path, _ in renditions.values()]
+            )
+        
+        # Steps 5-7: Upload to S3 (with any extra renditions), probe the final video and
+        # sign the streaming URL concurrently (signing only needs the key, the probe reads the local file)
+        logger.info("[%s] Uploading final video to S3", job_id)
+        s3_uri, video_info, presigned_url, *_ = await asyncio.gather(
+            S3Service.upload_file(
+                local_path=burned_video_path,
+                s3_key=s3_key,
+                content_type="video/mp4"
+            ),
+            asyncio.to_thread(FFmpegService.get_video_metadata, str(burned_video_path)),
+            S3Service.get_presigned_url(s3_key),
+            *(
+                S3Service.upload_file(local_path=path, s3_key=key, content_type="video/mp4")
+                for _, path, key in renditions.values()
+            )
+        )
         
         # Step 8: Update DynamoDB with success status + language + animals
         update_data_dict = {
@@ -191,14 +362,17 @@ async def process_video(
         if animals_dict:
             update_data_dict["animals_detected"] = animals_dict
         
+        if renditions:
+            update_data_dict["renditions"] = {label: key for label, (_, _, key) in renditions.items()}
+        
         update_data = VideoUpdateRequest(**update_data_dict)
         
-        await DynamoDBService.update_video(video_id, update_data)
+        await DynamoDBService.update_video(video_id, update_data, return_updated=False)
         
         # Schedule cleanup
         background_tasks.add_task(cleanup_files, temp_files)
         
-        logger.info(f"[{job_id}] Video processing completed successfully")
+        logger.info("[%s] Video processing completed successfully", job_id)
         
         return {
             "status": "success",
@@ -216,7 +390,8 @@ async def process_video(
                 "duration": video_info.get("duration"),
                 "file_size": video_info.get("size"),
                 "detected_language": detected_language,
-                "animals_detected": animals_dict
+                "animals_detected": animals_dict,
+                "renditions": update_data_dict.get("renditions")
             }
         }
     
@@ -224,19 +399,21 @@ async def process_video(
         if video_id:
             await DynamoDBService.update_video(
                 video_id,
-                VideoUpdateRequest(status=VideoStatus.FAILED, error_message="HTTP error occurred")
+                VideoUpdateRequest(status=VideoStatus.FAILED, error_message="HTTP error occurred"),
+                return_updated=False
             )
-        cleanup_files(temp_files)
+        await cleanup_files_async(temp_files)
         raise
     
     except Exception as e:
-        logger.error(f"[{job_id}] Processing failed: {str(e)}", exc_info=True)
+        logger.error("[%s] Processing failed: %s", job_id, e, exc_info=True)
         if video_id:
             await DynamoDBService.update_video(
                 video_id,
-                VideoUpdateRequest(status=VideoStatus.FAILED, error_message=str(e))
+                VideoUpdateRequest(status=VideoStatus.FAILED, error_message=str(e)),
+                return_updated=False
             )
-        cleanup_files(temp_files)
+        await cleanup_files_async(temp_files)
         raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
 
 
@@ -247,6 +424,7 @@ async def process_video(
         200: {"description": "Video stream"},
         206: {"description": "Partial content (range request)"},
         302: {"description": "Redirect to presigned S3 URL"},
+        304: {"description": "Not modified (If-None-Match matched the ETag)"},
         404: {"description": "Video not found"}
     }
 )
@@ -255,35 +433,51 @@ async def stream_video(filename: str, request: Request):
     Stream video from S3. 
     For simple requests, redirects to presigned URL.
     For range requests, streams through the server.
+    Honors If-None-Match (304) and If-Range using the S3 ETag/Last-Modified.
     """
     s3_key = filename
     
-    # Check if file exists in S3
-    if not await S3Service.file_exists(s3_key):
-        logger.warning(f"Stream attempt for non-existent file: {filename}")
+    # A single HEAD checks existence and gives the size and validators
+    file_info = await S3Service.get_file_info(s3_key)
+    
+    if file_info is None:
+        logger.warning("Stream attempt for non-existent file: %s", filename)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
     
+    file_size = file_info["size"]
+    validators = {}
+    if file_info["etag"]:
+        validators["ETag"] = file_info["etag"]
+    if file_info["last_modified"]:
+        validators["Last-Modified"] = format_datetime(file_info["last_modified"], usegmt=True)
+    
+    # Client already has this exact version
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and "ETag" in validators and _etag_matches(if_none_match, validators["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators)
+    
     range_header = request.headers.get("range")
     
+    # A stale If-Range means the client must get the whole (new) file instead of a part
+    if_range = request.headers.get("if-range")
+    if range_header and if_range and if_range not in validators.values():
+        range_header = None
+    
     if not range_header:
         # Simple request - redirect to presigned URL
         presigned_url = await S3Service.get_presigned_url(s3_key)
         return RedirectResponse(url=presigned_url, status_code=302)
     
     # Range request - stream through server for better compatibility
-    file_size = await S3Service.get_file_size(s3_key)
-    
-    if file_size is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
     
     # Parse range header
-    range_match = range_header.replace("bytes=", "").split("-")
-    try:
-        start = int(range_match[0]) if range_match[0] else 0
-        end = int(range_match[1]) if len(range_match) > 1 and range_match[1] else file_size - 1
-    except ValueError:
+    range_match = RANGE_RE.fullmatch(range_header.strip())
+    if not range_match:
         raise HTTPException(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, detail="Invalid range format")
     
+    start = int(range_match.group(1)) if range_match.group(1) else 0
+    end = int(range_match.group(2)) if range_match.group(2) else file_size - 1
+    
     if start >= file_size or end >= file_size or start > end:
         raise HTTPException(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, detail="Invalid range")
     
@@ -294,6 +488,7 @@ async def stream_video(filename: str, request: Request):
         "Accept-Ranges": "bytes",
         "Content-Length": str(chunk_size),
         "Content-Type": "video/mp4",
+        **validators,
     }
     
     return StreamingResponse(
@@ -304,7 +499,10 @@ async def stream_video(filename: str, request: Request):
     )
 
 
-@router.get("/videos/{video_id}")
+@router.get(
+    "/videos/{video_id}",
+    responses={200: {"content": {"application/json": {"example": VIDEO_METADATA_EXAMPLE}}}}
+)
 async def get_video_metadata(video_id: str) -> dict:
     """Get video metadata by ID (including detected_language and animals_detected)."""
     video = await DynamoDBService.get_video(video_id)
@@ -316,12 +514,15 @@ async def get_video_metadata(video_id: str) -> dict:
         try:
             video.link = await S3Service.get_presigned_url(video.s3_key)
         except Exception as e:
-            logger.warning(f"Failed to generate presigned URL: {e}")
+            logger.warning("Failed to generate presigned URL: %s", e)
     
     return video.model_dump()
 
 
-@router.get("/videos/by-source/{source_video_id}")
+@router.get(
+    "/videos/by-source/{source_video_id}",
+    responses={200: {"content": {"application/json": {"example": VIDEO_METADATA_EXAMPLE}}}}
+)
 async def get_video_by_source_id(source_video_id: str) -> dict:
     """
     Retrieve aggregated video metadata by source video ID from vidp-fastapi-service.
@@ -339,28 +540,56 @@ async def get_video_by_source_id(source_video_id: str) -> dict:
         try:
             video.link = await S3Service.get_presigned_url(video.s3_key)
         except Exception as e:
-            logger.warning(f"Failed to generate presigned URL: {e}")
+            logger.warning("Failed to generate presigned URL: %s", e)
     
     return video.model_dump()
 
 
 @router.get("/videos/")
-async def list_videos(status: Optional[VideoStatus] = None, limit: int = 100) -> dict:
-    """List all videos with optional status filter."""
-    videos = await DynamoDBService.list_videos(status=status, limit=limit)
+async def list_videos(
+    status: Optional[VideoStatus] = None,
+    limit: int = Query(default=100, ge=1, le=1000, description="Maximum number of videos per page"),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
+) -> ORJSONResponse:
+    """
+    List videos with optional status filter, one page at a time.
     
-    # Generate fresh presigned URLs for all videos
-    for video in videos:
-        if video.s3_key:
-            try:
-                video.link = await S3Service.get_presigned_url(video.s3_key)
-            except Exception as e:
-                logger.warning(f"Failed to generate presigned URL for {video.id}: {e}")
+    Pass the returned next_cursor back as cursor to fetch the next page.
+    Pass fields (comma-separated, e.g. "filename,status") to only read and return those fields.
+    """
+    start_key = _decode_cursor(cursor) if cursor else None
+    if start_key is not None and not DynamoDBService.is_valid_page_key(start_key, status):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    field_names = _parse_fields(fields) if fields else None
+    videos, last_key = await DynamoDBService.list_videos(
+        status=status, limit=limit, start_key=start_key, fields=field_names
+    )
     
-    return {
-        "total": len(videos), 
-        "videos": [video.model_dump() for video in videos]
-    }
+    # Generate fresh presigned URLs for all videos
+    await _refresh_links(videos)
+    
+    # Dump straight to JSON-ready dicts and skip FastAPI's jsonable_encoder pass
+    include = {"id", "videoId", *field_names} if field_names else None
+    return ORJSONResponse({
+        "total": len(videos),
+        "videos": [video.model_dump(mode="json", include=include) for video in videos],
+        "next_cursor": _encode_cursor(last_key)
+    })
+
+
+@router.post("/videos/batch")
+async def get_videos_batch(request: VideoBatchRequest) -> ORJSONResponse:
+    """Retrieve several videos by ID in a single DynamoDB round-trip."""
+    videos = await DynamoDBService.get_videos_batch(request.ids)
+    
+    await _refresh_links(videos)
+    
+    # Dump straight to JSON-ready dicts and skip FastAPI's jsonable_encoder pass
+    return ORJSONResponse({
+        "total": len(videos),
+        "videos": [video.model_dump(mode="json") for video in videos]
+    })
 
 
 @router.delete("/videos/{video_id}")
@@ -370,13 +599,15 @@ async def delete_video(video_id: str, background_tasks: BackgroundTasks) -> dict
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
     
-    # Delete from S3
-    if video.s3_key:
+    # Delete the video and its extra renditions from S3 in one request
+    s3_keys = [video.s3_key] if video.s3_key else []
+    s3_keys.extend((video.renditions or {}).values())
+    if s3_keys:
         try:
-            await S3Service.delete_file(video.s3_key)
-            logger.info(f"Deleted video from S3: {video.s3_key}")
+            deleted_keys = await S3Service.delete_files(s3_keys)
+            logger.info("Deleted video from S3: %s", deleted_keys)
         except Exception as e:
-            logger.warning(f"Failed to delete from S3: {e}")
+            logger.warning("Failed to delete from S3: %s", e)
     
     # Delete from DynamoDB
     deleted = await DynamoDBService.delete_video(video_id)
@@ -389,17 +620,11 @@ async def delete_video(video_id: str, background_tasks: BackgroundTasks) -> dict
 @router.get("/health")
 async def health_check() -> dict:
     """Health check endpoint."""
-    dynamodb_status = await DynamoDBService.is_connected()
-    
-    # Check S3 access
-    s3_status = False
-    try:
-        session = S3Service._get_session()
-        async with session.client("s3") as s3:
-            await s3.head_bucket(Bucket=settings.S3_BUCKET_NAME)
-            s3_status = True
-    except Exception:
-        s3_status = False
+    # Check DynamoDB and S3 access concurrently
+    dynamodb_status, s3_status = await asyncio.gather(
+        DynamoDBService.is_connected(),
+        S3Service.check_bucket()
+    )
     
     return {
         "status": "healthy" if (dynamodb_status and s3_status) else "degraded",
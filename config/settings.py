@@ -7,10 +7,12 @@ Centralizes environment variables, paths, and service endpoints using
 Pydantic settings management for type safety and validation.
 """
 
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
-from pydantic_settings import BaseSettings
-from pydantic import Field, field_validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, field_validator
 
 
 class Settings(BaseSettings):
@@ -68,6 +70,31 @@ class Settings(BaseSettings):
         ge=60,
         description="Presigned URL expiration time in seconds"
     )
+    S3_METADATA_CACHE_TTL: int = Field(
+        default=60,
+        ge=0,
+        description="Seconds to reuse HeadObject results (size, ETag) for streaming; 0 disables"
+    )
+    S3_MAX_POOL_CONNECTIONS: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum pooled HTTP connections of the shared S3 client (each open stream holds one)"
+    )
+    S3_MULTIPART_THRESHOLD: int = Field(
+        default=8 * 1024 * 1024,  # 8MB
+        ge=5 * 1024 * 1024,  # S3 minimum part size
+        description="File size above which uploads use parallel multipart upload"
+    )
+    S3_MULTIPART_CHUNKSIZE: int = Field(
+        default=16 * 1024 * 1024,  # 16MB
+        ge=5 * 1024 * 1024,  # S3 minimum part size
+        description="Part size for multipart uploads in bytes"
+    )
+    S3_MAX_CONCURRENCY: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of parts uploaded concurrently"
+    )
     
     # ========== DynamoDB Configuration ==========
     DYNAMODB_TABLE_NAME: str = Field(
@@ -78,6 +105,26 @@ class Settings(BaseSettings):
         default=None,
         description="DynamoDB endpoint URL (for local development with DynamoDB Local)"
     )
+    DYNAMODB_MAX_POOL_CONNECTIONS: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum pooled HTTP connections for the DynamoDB client"
+    )
+    DYNAMODB_SCAN_SEGMENTS: int = Field(
+        default=4,
+        ge=1,
+        le=1000000,
+        description="Parallel segments used to scan the table when listing videos without a status filter"
+    )
+    DYNAMODB_ITEM_CACHE_TTL: int = Field(
+        default=0,
+        ge=0,
+        description="Seconds to reuse single-video reads in this process; each worker has its own cache, so reads may miss another worker's writes for that long (0 disables)"
+    )
+    DAX_ENDPOINT: Optional[str] = Field(
+        default=None,
+        description="DynamoDB Accelerator cluster endpoint for item reads/writes (requires amazon-dax-client)"
+    )
     
     # ========== External Service URLs ==========
     SUBTITLE_SERVICE_URL: str = Field(
@@ -146,6 +193,44 @@ class Settings(BaseSettings):
         ge=30,
         description="FFmpeg operation timeout in seconds"
     )
+    FFMPEG_USE_GPU: bool = Field(
+        default=False,
+        description="Use NVIDIA CUDA decoding and NVENC encoding (falls back to FFMPEG_CODEC on failure)"
+    )
+    FFMPEG_GPU_CODEC: str = Field(
+        default="h264_nvenc",
+        description="Hardware video codec used when FFMPEG_USE_GPU is enabled"
+    )
+    FFMPEG_GPU_PRESET: str = Field(
+        default="p4",
+        description="NVENC preset (p1 fastest - p7 best quality)"
+    )
+    FFMPEG_GPU_TUNE: str = Field(
+        default="hq",
+        description="NVENC tuning (hq, ll, ull)"
+    )
+    FFMPEG_GPU_SCALE_FILTER: str = Field(
+        default="scale_cuda",
+        description="GPU scaling filter used when frames stay in VRAM (scale_cuda or scale_npp)"
+    )
+    FFMPEG_GPU_SUBTITLE_OVERLAY: bool = Field(
+        default=True,
+        description="On the GPU path, composite subtitles with overlay_cuda instead of downloading every frame to the CPU"
+    )
+    FFMPEG_GPU_DEVICES: list[int] = Field(
+        default=[0],
+        min_length=1,
+        description="CUDA device indexes that GPU encodes are distributed over (round-robin)"
+    )
+    FFMPEG_LOW_MEMORY: bool = Field(
+        default=False,
+        description="Shrink encoder lookahead buffers (x264/x265 -tune zerolatency, VPx/AOM -lag-in-frames 0, NVENC -rc-lookahead 0) at some cost in compression"
+    )
+    MAX_CONCURRENT_TRANSCODES: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum FFmpeg encodes running at once (size to the NVENC session limit across GPUs)"
+    )
     
     # ========== Logging Configuration ==========
     LOG_LEVEL: str = Field(
@@ -162,32 +247,32 @@ class Settings(BaseSettings):
     )
     
     # ========== Security Configuration ==========
-    ALLOWED_EXTENSIONS: list[str] = Field(
-        default=[".mp4", ".avi", ".mov", ".mkv"],
-        description="Allowed video file extensions"
+    ALLOWED_EXTENSIONS: frozenset[str] = Field(
+        default=frozenset({".mp4", ".avi", ".mov", ".mkv"}),
+        description="Allowed video file extensions (lowercased, for constant-time lookups)"
+    )
+    CORS_ALLOWED_ORIGINS: list[str] = Field(
+        default=["*"],
+        description="Origins allowed by CORS (explicit origins skip the wildcard handling)"
     )
     
-    model_config = {
-        "env_file": ".env",
-        "env_file_encoding": "utf-8",
-        "case_sensitive": True,
-        "extra": "ignore"
-    }
+    model_config = SettingsConfigDict(
+        # APP_ENV_FILE lets tests/CI point elsewhere (e.g. /dev/null) to skip reading .env
+        env_file=os.getenv("APP_ENV_FILE", ".env"),
+        env_file_encoding="utf-8",
+        env_ignore_empty=True,
+        case_sensitive=True,
+        extra="ignore"
+    )
     
     # Validators
     
-    @model_validator(mode='after')
-    def set_api_url_default(self):
+    @cached_property
+    def api_url(self) -> str:
         """
-        Automatically set API_URL based on HOST and PORT if not provided.
+        Public base URL without trailing slash, derived from HOST and PORT if API_URL is not set.
         """
-        if not self.API_URL:
-            self.API_URL = f"http://{self.HOST}:{self.PORT}"
-        
-        if self.API_URL.endswith('/'):
-            self.API_URL = self.API_URL[:-1]
-            
-        return self
+        return (self.API_URL or f"http://{self.HOST}:{self.PORT}").rstrip("/")
 
     @field_validator("TEMP_DIR", mode="before")
     @classmethod
@@ -213,6 +298,12 @@ class Settings(BaseSettings):
         storage_path.mkdir(parents=True, exist_ok=True)
         return storage_path
     
+    @field_validator("ALLOWED_EXTENSIONS")
+    @classmethod
+    def normalize_extensions(cls, v):
+        """Lowercase extensions so lookups can match Path.suffix.lower()."""
+        return frozenset(ext.lower() for ext in v)
+    
     @field_validator("LOG_LEVEL")
     @classmethod
     def validate_log_level(cls, v):
@@ -233,5 +324,11 @@ class Settings(BaseSettings):
         return v
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, built (and validated) once."""
+    return Settings()
+
+
 # Singleton settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -7,26 +7,54 @@ Initializes the FastAPI app, configures middleware, and sets up
 AWS services (S3 and DynamoDB) connections and routing.
 """
 
+import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from config.settings import settings
 from api.routes import router
+from api.middleware import UploadSizeLimitMiddleware, UPLOAD_BODY_OVERHEAD
 from services.dynamodb_service import DynamoDBService
 from services.s3_service import S3Service
 
-# Configure logging
-logging.basicConfig(
-    level=settings.LOG_LEVEL,
-    format=settings.LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        *([logging.FileHandler(settings.LOG_FILE)] if settings.LOG_FILE else [])
-    ]
-)
+# Configure logging (basicConfig is a no-op if the root logger already has handlers,
+# e.g. on reload). The log file is only opened on the first record and reopened
+# if it is rotated externally.
+# Records are handed to a queue and written by a listener thread, so request
+# handlers never block on console or file I/O.
+log_handlers = [
+    logging.StreamHandler(),
+    *([logging.handlers.WatchedFileHandler(settings.LOG_FILE, delay=True)] if settings.LOG_FILE else [])
+]
+log_formatter = logging.Formatter(settings.LOG_FORMAT)
+
+# Skip the per-record lookups LOG_FORMAT does not print: the caller's frame
+# (findCaller walks the stack for every record), thread and process
+if not any(f"%({attr})" in settings.LOG_FORMAT for attr in ("pathname", "filename", "module", "funcName", "lineno")):
+    logging._srcfile = None
+logging.logThreads = "%(thread" in settings.LOG_FORMAT
+logging.logProcesses = "%(process)" in settings.LOG_FORMAT
+logging.logMultiprocessing = "%(processName)" in settings.LOG_FORMAT
+for log_handler in log_handlers:
+    log_handler.setFormatter(log_formatter)
+
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush the queue on exit, after the last shutdown log
+
+# The queue handler only merges the message arguments; LOG_FORMAT is applied by the listener's handlers
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+logging.basicConfig(level=settings.LOG_LEVEL, handlers=[queue_handler])
 
 logger = logging.getLogger(__name__)
 
@@ -39,35 +67,41 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Video Aggregation Service...")
     
-    # Initialize S3
-    try:
-        await S3Service.initialize()
-        logger.info(f"S3 connection established - Bucket: {settings.S3_BUCKET_NAME}")
-    except Exception as e:
-        logger.error(f"Failed to initialize S3: {e}")
-        raise
-    
-    # Connect to DynamoDB
-    try:
-        await DynamoDBService.connect()
-        logger.info(f"DynamoDB connection established - Table: {settings.DYNAMODB_TABLE_NAME}")
-    except Exception as e:
-        logger.error(f"Failed to connect to DynamoDB: {e}")
-        raise
+    # Initialize S3 and connect to DynamoDB concurrently (independent round trips)
+    s3_result, dynamodb_result = await asyncio.gather(
+        S3Service.initialize(),
+        DynamoDBService.connect(),
+        return_exceptions=True
+    )
+
+    if isinstance(s3_result, BaseException):
+        logger.error("Failed to initialize S3: %s", s3_result)
+    else:
+        logger.info("S3 connection established - Bucket: %s", settings.S3_BUCKET_NAME)
+
+    if isinstance(dynamodb_result, BaseException):
+        logger.error("Failed to connect to DynamoDB: %s", dynamodb_result)
+    else:
+        logger.info("DynamoDB connection established - Table: %s", settings.DYNAMODB_TABLE_NAME)
+
+    for result in (s3_result, dynamodb_result):
+        if isinstance(result, BaseException):
+            raise result
     
-    # Ensure temp directory exists (for local processing)
-    settings.TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    # Build (and cache) the OpenAPI schema now rather than on the first /docs hit
+    app.openapi()
     
-    logger.info(f"Temporary directory: {settings.TEMP_DIR}")
-    logger.info(f"S3 Bucket: {settings.S3_BUCKET_NAME}")
-    logger.info(f"AWS Region: {settings.AWS_REGION}")
-    logger.info(f"Server starting on {settings.HOST}:{settings.PORT}")
+    # TEMP_DIR was created when the settings were validated
+    logger.info("Temporary directory: %s", settings.TEMP_DIR)
+    logger.info("S3 Bucket: %s", settings.S3_BUCKET_NAME)
+    logger.info("AWS Region: %s", settings.AWS_REGION)
+    logger.info("Server starting on %s:%s", settings.HOST, settings.PORT)
     
     yield
     
     # Shutdown
     logger.info("Shutting down Video Aggregation Service...")
-    await DynamoDBService.disconnect()
+    await asyncio.gather(DynamoDBService.disconnect(), S3Service.disconnect())
     logger.info("AWS services disconnected")
 
 
@@ -76,15 +110,22 @@ app = FastAPI(
     title=settings.API_TITLE,
     version=settings.API_VERSION,
     description=settings.API_DESCRIPTION,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Configure CORS
+# Reject oversized uploads from Content-Length before reading the body
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_body_size=settings.MAX_UPLOAD_SIZE + UPLOAD_BODY_OVERHEAD
+)
+
+# Configure CORS (added last so it also wraps 413 responses)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=settings.CORS_ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
     allow_headers=["*"],
 )
 
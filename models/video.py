@@ -6,9 +6,9 @@ Updated for DynamoDB and Pydantic v2 compatibility.
 """
 
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from enum import Enum
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, computed_field
 
 
 class VideoStatus(str, Enum):
@@ -38,10 +38,14 @@ class VideoMetadata(BaseModel):
         status: Current processing status.
         detected_language: Language code detected (e.g., 'fr', 'en', 'es').
         animals_detected: Dictionary of detected animals with counts (e.g., {'dog': 5, 'cat': 2}).
+        renditions: S3 keys of additional resolutions, keyed by resolution label.
         created_at: Timestamp of creation.
     """
-    videoId: Optional[str] = Field(default=None, description="Unique video ID (UUID) - Primary Key")
-    id: Optional[str] = Field(default=None, description="Alias for videoId")
+    videoId: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices("videoId", "id"),
+        description="Unique video ID (UUID) - Primary Key (also accepted as 'id')"
+    )
     
     # Reference to the original video in vidp-fastapi-service database
     source_video_id: Optional[str] = Field(None, description="Video ID from the main service (vidp-fastapi-service)")
@@ -66,6 +70,12 @@ class VideoMetadata(BaseModel):
         description="Animals detected by YOLO service with their counts (e.g., {'dog': 5, 'cat': 2})"
     )
     
+    renditions: Optional[Dict[str, str]] = Field(
+        None,
+        description="S3 keys of additional resolutions encoded with the main video (e.g. {'720p': 'job_..._720p.mp4'})"
+    )
+    
+    # ISO strings from DynamoDB are parsed by pydantic-core's native datetime validator
     created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
     updated_at: datetime = Field(default_factory=datetime.now, description="Last update timestamp")
     
@@ -74,43 +84,36 @@ class VideoMetadata(BaseModel):
     # Pydantic v2 Configuration
     model_config = ConfigDict(
         populate_by_name=True,
-        json_schema_extra={
-            "example": {
-                "videoId": "550e8400-e29b-41d4-a716-446655440000",
-                "id": "550e8400-e29b-41d4-a716-446655440000",
-                "source_video_id": "550e8400-e29b-41d4-a716-446655440001",
-                "filename": "sample_video.mp4",
-                "file_path": "videos/job_abc123_final.mp4",
-                "s3_key": "job_abc123_final.mp4",
-                "link": "https://bucket.s3.amazonaws.com/videos/job_abc123_final.mp4",
-                "status": "saved",
-                "file_size": 15728640,
-                "duration": 120.5,
-                "resolution": "1920x1080",
-                "detected_language": "fr",
-                "animals_detected": {
-                    "dog": 5,
-                    "cat": 2,
-                    "bird": 1
-                }
-            }
-        }
+        defer_build=True  # Build the validator on first use instead of at import
     )
     
-    @field_validator("created_at", "updated_at", mode="before")
-    @classmethod
-    def parse_datetime(cls, v):
-        """Parse datetime from ISO format string if needed."""
-        if isinstance(v, str):
-            return datetime.fromisoformat(v)
-        return v
-    
-    def model_post_init(self, __context):
-        """Ensure videoId and id are synchronized."""
-        if self.videoId and not self.id:
-            self.id = self.videoId
-        elif self.id and not self.videoId:
-            self.videoId = self.id
+    @computed_field
+    @property
+    def id(self) -> Optional[str]:
+        """Alias for videoId (kept in responses for backward compatibility)."""
+        return self.videoId
+
+
+# Example VideoMetadata payload, shown in the OpenAPI docs of the metadata routes
+VIDEO_METADATA_EXAMPLE = {
+    "videoId": "550e8400-e29b-41d4-a716-446655440000",
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "source_video_id": "550e8400-e29b-41d4-a716-446655440001",
+    "filename": "sample_video.mp4",
+    "file_path": "videos/job_abc123_final.mp4",
+    "s3_key": "job_abc123_final.mp4",
+    "link": "https://bucket.s3.amazonaws.com/videos/job_abc123_final.mp4",
+    "status": "saved",
+    "file_size": 15728640,
+    "duration": 120.5,
+    "resolution": "1920x1080",
+    "detected_language": "fr",
+    "animals_detected": {
+        "dog": 5,
+        "cat": 2,
+        "bird": 1
+    }
+}
 
 
 class VideoCreateRequest(BaseModel):
@@ -129,6 +132,13 @@ class VideoCreateRequest(BaseModel):
     animals_detected: Optional[Dict[str, int]] = None
 
 
+class VideoBatchRequest(BaseModel):
+    """
+    Request model for fetching several videos at once.
+    """
+    ids: List[str] = Field(..., min_length=1, max_length=100, description="Video IDs to retrieve (at most 100)")
+
+
 class VideoUpdateRequest(BaseModel):
     """
     Request model for updating video metadata.
@@ -142,4 +152,5 @@ class VideoUpdateRequest(BaseModel):
     link: Optional[str] = None
     s3_key: Optional[str] = None
     detected_language: Optional[str] = None
-    animals_detected: Optional[Dict[str, int]] = None
\ No newline at end of file
+    animals_detected: Optional[Dict[str, int]] = None
+    renditions: Optional[Dict[str, str]] = None
\ No newline at end of file
@@ -5,13 +5,24 @@ Amazon DynamoDB service for video metadata management.
 Handles connection, CRUD operations, and error logging.
 """
 
+import asyncio
+import json
 import logging
+import threading
+import time
+import types
 import uuid
-from typing import Optional, List
+from functools import lru_cache
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime
 from decimal import Decimal
 
 import aioboto3
+import botocore.parsers
+import botocore.session
+import orjson
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from config.settings import settings
@@ -19,6 +30,67 @@ from models.video import VideoMetadata, VideoStatus, VideoCreateRequest, VideoUp
 
 logger = logging.getLogger(__name__)
 
+# DynamoDB BatchGetItem accepts at most 100 keys per request
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_RETRIES = 5
+
+# Bound on items kept by the in-process read cache (oldest inserted evicted first,
+# FIFO), and how long a health-check table probe is reused (seconds)
+ITEM_CACHE_SIZE = 10000
+TABLE_CHECK_CACHE_TTL = 30
+
+# Attributes always read by projected queries: the fields VideoMetadata requires,
+# plus what listing needs to sort and to refresh presigned links
+PROJECTION_BASE_FIELDS = ("videoId", "filename", "file_path", "link", "s3_key", "created_at")
+
+# Keep pooled connections alive between requests, fail fast on a dead
+# connection and let adaptive retries absorb throttling
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=settings.DYNAMODB_MAX_POOL_CONNECTIONS,
+    connect_timeout=1,
+    read_timeout=3,
+    retries={"max_attempts": 10, "mode": "adaptive"}
+)
+
+# botocore decodes JSON responses with the stdlib json module. Rebind the name in
+# botocore.parsers only (the global json module is untouched) so DynamoDB responses
+# are decoded by orjson, about twice as fast on large query/scan pages. The stand-in
+# keeps every other json attribute (dumps, JSONDecodeError, ...), and the patch is
+# skipped if botocore no longer uses the json module there (botocore is pinned in
+# requirements.txt through aioboto3).
+if getattr(botocore.parsers, "json", None) is json:
+    botocore.parsers.json = types.SimpleNamespace(**{**vars(json), "loads": orjson.loads})
+
+# Fallbacks for attribute types this service does not write itself (sets, binary)
+_type_serializer = TypeSerializer()
+_type_deserializer = TypeDeserializer()
+
+
+@lru_cache(maxsize=128)
+def _update_expression(fields: Tuple[str, ...]) -> Tuple[str, Dict[str, str]]:
+    """
+    Build the SET UpdateExpression and ExpressionAttributeNames for the given fields.
+    
+    Values are bound as :val0, :val1, ... in field order. The returned names
+    dict is shared between calls and must not be modified.
+    """
+    update_expression = "SET " + ", ".join(f"#attr{i} = :val{i}" for i in range(len(fields)))
+    return update_expression, {f"#attr{i}": field for i, field in enumerate(fields)}
+
+
+@lru_cache(maxsize=128)
+def _projection(fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Build ProjectionExpression/ExpressionAttributeNames reading only the given fields
+    (plus PROJECTION_BASE_FIELDS). Names are aliased to avoid reserved words.
+    """
+    names = tuple(dict.fromkeys(PROJECTION_BASE_FIELDS + fields))
+    return {
+        "ProjectionExpression": ", ".join(f"#proj{i}" for i in range(len(names))),
+        "ExpressionAttributeNames": {f"#proj{i}": name for i, name in enumerate(names)}
+    }
+
 
 class DynamoDBService:
     """
@@ -27,6 +99,15 @@ class DynamoDBService:
     """
     
     _session: Optional[aioboto3.Session] = None
+    _client_cm = None
+    _client = None
+    _client_lock = asyncio.Lock()
+    _dax_client = None
+    _dax_lock = threading.Lock()
+    _item_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+    _source_ids: Dict[str, str] = {}
+    _table_check: Optional[Tuple[bool, float]] = None
+    _source_index_check: Optional[Tuple[bool, float]] = None
     
     @classmethod
     def _get_session(cls) -> aioboto3.Session:
@@ -50,34 +131,103 @@ class DynamoDBService:
     @classmethod
     def _get_client_kwargs(cls) -> dict:
         """Get client kwargs including endpoint URL for local development."""
-        kwargs = {}
+        kwargs = {"config": CLIENT_CONFIG}
         if settings.DYNAMODB_ENDPOINT_URL:
             kwargs["endpoint_url"] = settings.DYNAMODB_ENDPOINT_URL
         return kwargs
     
+    @classmethod
+    async def _get_client(cls):
+        """
+        Get the shared low-level DynamoDB client, opening it on first use.
+        
+        The client (and its HTTP connection pool) stays open until disconnect(),
+        so requests reuse warm connections instead of a new TLS handshake each.
+        Items are exchanged in wire format, see _serialize_item/_deserialize_item.
+        """
+        if cls._client is None:
+            async with cls._client_lock:
+                if cls._client is None:
+                    client_cm = cls._get_session().client("dynamodb", **cls._get_client_kwargs())
+                    cls._client = await client_cm.__aenter__()
+                    cls._client_cm = client_cm
+        return cls._client
+    
+    @classmethod
+    def _get_dax_client(cls):
+        """Get or create the (synchronous) DAX client."""
+        if cls._dax_client is None:
+            with cls._dax_lock:
+                if cls._dax_client is None:
+                    # Optional dependency, only needed when DAX_ENDPOINT is set
+                    from amazondax import AmazonDaxClient
+                    
+                    # Same credentials as the DynamoDB client: settings read from .env
+                    # are not in os.environ, where the default chain would look
+                    session = botocore.session.get_session()
+                    if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
+                        session.set_credentials(settings.AWS_ACCESS_KEY_ID, settings.AWS_SECRET_ACCESS_KEY)
+                    
+                    cls._dax_client = AmazonDaxClient(
+                        session,
+                        endpoint_url=settings.DAX_ENDPOINT,
+                        region_name=settings.AWS_REGION
+                    )
+        return cls._dax_client
+    
+    @classmethod
+    async def _item_call(cls, operation: str, **kwargs) -> dict:
+        """
+        Run a single-item operation (get_item, put_item, update_item, delete_item) on the table.
+        
+        When DAX_ENDPOINT is set, the call goes through the DAX cluster so reads are
+        served from its item cache; writes use the same path, which keeps that cache
+        write-through. The DAX client is synchronous and runs in a worker thread.
+        Queries are not routed through DAX: its query cache is not invalidated by writes.
+        
+        Args:
+            operation: Client method name.
+            **kwargs: Arguments for the operation, other than TableName.
+            
+        Returns:
+            dict: The operation response.
+        """
+        if settings.DAX_ENDPOINT:
+            dax = cls._get_dax_client()
+            return await asyncio.to_thread(
+                getattr(dax, operation), TableName=settings.DYNAMODB_TABLE_NAME, **kwargs
+            )
+        
+        dynamodb = await cls._get_client()
+        return await getattr(dynamodb, operation)(TableName=settings.DYNAMODB_TABLE_NAME, **kwargs)
+    
     @classmethod
     async def connect(cls):
         """
         Initialize DynamoDB connection and create table if needed.
         """
         try:
-            session = cls._get_session()
-            client_kwargs = cls._get_client_kwargs()
-            
-            async with session.client("dynamodb", **client_kwargs) as dynamodb:
-                # Check if table exists
-                try:
-                    await dynamodb.describe_table(TableName=settings.DYNAMODB_TABLE_NAME)
-                    logger.info(f"DynamoDB table verified: {settings.DYNAMODB_TABLE_NAME}")
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                        # Create table
-                        await cls._create_table(dynamodb)
-                    else:
-                        raise
-                        
+            # Building the session loads botocore data files synchronously: keep it off the loop
+            await asyncio.to_thread(cls._get_session)
+            dynamodb = await cls._get_client()
+            
+            # Check if table exists
+            try:
+                description = await dynamodb.describe_table(TableName=settings.DYNAMODB_TABLE_NAME)
+                logger.info("DynamoDB table verified: %s", settings.DYNAMODB_TABLE_NAME)
+                cls._check_source_index(description["Table"])
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "ResourceNotFoundException":
+                    # Create table
+                    await cls._create_table(dynamodb)
+                else:
+                    raise
+            
+            # The table was just verified (and the connection warmed up)
+            cls._table_check = (True, time.monotonic() + TABLE_CHECK_CACHE_TTL)
+        
         except Exception as e:
-            logger.error(f"Failed to connect to DynamoDB: {e}")
+            logger.error("Failed to connect to DynamoDB: %s", e)
             raise
     
     @classmethod
@@ -85,7 +235,7 @@ class DynamoDBService:
         """
         Create the DynamoDB table with necessary indexes.
         """
-        logger.info(f"Creating DynamoDB table: {settings.DYNAMODB_TABLE_NAME}")
+        logger.info("Creating DynamoDB table: %s", settings.DYNAMODB_TABLE_NAME)
         
         await dynamodb.create_table(
             TableName=settings.DYNAMODB_TABLE_NAME,
@@ -145,52 +295,136 @@ class DynamoDBService:
         waiter = dynamodb.get_waiter("table_exists")
         await waiter.wait(TableName=settings.DYNAMODB_TABLE_NAME)
         
-        logger.info(f"DynamoDB table created: {settings.DYNAMODB_TABLE_NAME}")
+        logger.info("DynamoDB table created: %s", settings.DYNAMODB_TABLE_NAME)
+    
+    @classmethod
+    def _check_source_index(cls, table: dict) -> bool:
+        """
+        Record whether the table's source_video_id GSI exists and is ACTIVE.
+        
+        Tables created before the index existed need it added out of band
+        (it is defined in _create_table); until then lookups fall back to a Scan.
+        """
+        active = any(
+            index["IndexName"] == "source_video_id-index" and index.get("IndexStatus") == "ACTIVE"
+            for index in table.get("GlobalSecondaryIndexes", [])
+        )
+        if not active:
+            logger.warning(
+                "source_video_id-index is missing or not ACTIVE on %s; source ID lookups will scan",
+                settings.DYNAMODB_TABLE_NAME
+            )
+        cls._source_index_check = (active, time.monotonic() + TABLE_CHECK_CACHE_TTL)
+        return active
+    
+    @classmethod
+    async def _source_index_active(cls, dynamodb) -> bool:
+        """Whether source_video_id-index can be queried, re-checked every TABLE_CHECK_CACHE_TTL seconds."""
+        if cls._source_index_check and cls._source_index_check[1] > time.monotonic():
+            return cls._source_index_check[0]
+        
+        description = await dynamodb.describe_table(TableName=settings.DYNAMODB_TABLE_NAME)
+        return cls._check_source_index(description["Table"])
     
     @classmethod
     async def disconnect(cls):
         """
-        Cleanup resources (no persistent connection in DynamoDB).
+        Close the shared DynamoDB client and its connection pool.
         """
+        if cls._client_cm is not None:
+            client_cm = cls._client_cm
+            cls._client_cm = cls._client = None
+            await client_cm.__aexit__(None, None, None)
         logger.info("DynamoDB service disconnected")
     
     @classmethod
     def _serialize_item(cls, data: dict) -> dict:
         """
-        Serialize Python dict to DynamoDB item format.
-        Converts floats to Decimal and handles None values.
-        """
-        serialized = {}
-        for key, value in data.items():
-            if value is None:
-                continue
-            elif isinstance(value, float):
-                serialized[key] = Decimal(str(value))
-            elif isinstance(value, datetime):
-                serialized[key] = value.isoformat()
-            elif isinstance(value, VideoStatus):
-                serialized[key] = value.value
-            else:
-                serialized[key] = value
-        return serialized
+        Serialize Python dict to DynamoDB wire format ({"S": ...}, {"N": ...}, ...).
+        Top-level None values are skipped.
+        """
+        return {key: cls._serialize_value(value) for key, value in data.items() if value is not None}
+    
+    @classmethod
+    def _serialize_value(cls, value: Any) -> dict:
+        """Serialize a single Python value to a DynamoDB attribute value."""
+        if isinstance(value, VideoStatus):
+            return {"S": value.value}
+        if isinstance(value, str):
+            return {"S": value}
+        if isinstance(value, bool):
+            return {"BOOL": value}
+        if isinstance(value, int):
+            return {"N": str(value)}
+        if isinstance(value, float):
+            # Same number text the resource layer sent for Decimal(str(value))
+            return {"N": str(Decimal(str(value)))}
+        if isinstance(value, datetime):
+            return {"S": value.isoformat()}
+        if isinstance(value, dict):
+            return {"M": {k: cls._serialize_value(v) for k, v in value.items()}}
+        if isinstance(value, (list, tuple)):
+            return {"L": [cls._serialize_value(v) for v in value]}
+        if value is None:
+            return {"NULL": True}
+        return _type_serializer.serialize(value)
     
     @classmethod
     def _deserialize_item(cls, item: dict) -> dict:
         """
-        Deserialize DynamoDB item to Python dict.
-        Converts Decimal back to float/int.
+        Deserialize a DynamoDB wire-format item to Python dict.
+        Numbers become int or float directly, without a Decimal round-trip.
         """
-        deserialized = {}
-        for key, value in item.items():
-            if isinstance(value, Decimal):
-                # Convert to int if it's a whole number, otherwise float
-                if value % 1 == 0:
-                    deserialized[key] = int(value)
-                else:
-                    deserialized[key] = float(value)
-            else:
-                deserialized[key] = value
-        return deserialized
+        return {key: cls._deserialize_value(value) for key, value in item.items()}
+    
+    @classmethod
+    def _deserialize_value(cls, value: dict) -> Any:
+        """Deserialize a single DynamoDB attribute value."""
+        if "S" in value:
+            return value["S"]
+        if "N" in value:
+            number = value["N"]
+            if "." in number or "E" in number or "e" in number:
+                return float(number)
+            return int(number)
+        if "M" in value:
+            return {k: cls._deserialize_value(v) for k, v in value["M"].items()}
+        if "L" in value:
+            return [cls._deserialize_value(v) for v in value["L"]]
+        if "BOOL" in value:
+            return value["BOOL"]
+        if "NULL" in value:
+            return None
+        return _type_deserializer.deserialize(value)
+    
+    @classmethod
+    def _cached_item(cls, video_id: str) -> Optional[Dict[str, Any]]:
+        """Get a deserialized item from the read cache, if present and fresh."""
+        entry = cls._item_cache.get(video_id)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+        return None
+    
+    @classmethod
+    def _cache_item(cls, item: Dict[str, Any]):
+        """
+        Keep a full deserialized item for DYNAMODB_ITEM_CACHE_TTL seconds.
+        
+        When the cache is full, the oldest inserted entry is evicted (FIFO).
+        
+        The dict is cached rather than a VideoMetadata, since callers modify the
+        returned models (e.g. to refresh the link).
+        """
+        if not settings.DYNAMODB_ITEM_CACHE_TTL:
+            return
+        if len(cls._item_cache) >= ITEM_CACHE_SIZE:
+            cls._item_cache.pop(next(iter(cls._item_cache)))
+        if len(cls._source_ids) >= ITEM_CACHE_SIZE:
+            cls._source_ids.pop(next(iter(cls._source_ids)))
+        video_id = item["videoId"]
+        cls._item_cache[video_id] = (item, time.monotonic() + settings.DYNAMODB_ITEM_CACHE_TTL)
+        if item.get("source_video_id"):
+            cls._source_ids[item["source_video_id"]] = video_id
     
     @classmethod
     async def create_video(cls, video_data: VideoCreateRequest) -> VideoMetadata:
@@ -204,32 +438,27 @@ class DynamoDBService:
             VideoMetadata: The created video object with its generated ID.
         """
         try:
-            session = cls._get_session()
-            client_kwargs = cls._get_client_kwargs()
-            
             # Generate unique ID
             video_id = str(uuid.uuid4())
             now = datetime.now()
             
-            # Build item
-            item = video_data.model_dump()
+            # Build item (the request model is flat: copy its field values, no model_dump pass)
+            item = dict(video_data.__dict__)
             item["videoId"] = video_id  # Use videoId as primary key
             item["id"] = video_id  # Keep id for backward compatibility
-            item["created_at"] = now.isoformat()
-            item["updated_at"] = now.isoformat()
+            item["created_at"] = item["updated_at"] = now.isoformat()
             
-            # Ensure source_video_id has a value for GSI (use "NONE" as placeholder if null)
+            # Leave source_video_id out when unset, so the item stays out of the sparse
+            # source_video_id-index (an empty string is not a valid index key either)
             if not item.get("source_video_id"):
-                item["source_video_id"] = "NONE"
+                item["source_video_id"] = None
             
             # Serialize for DynamoDB
             serialized_item = cls._serialize_item(item)
             
-            async with session.resource("dynamodb", **client_kwargs) as dynamodb:
-                table = await dynamodb.Table(settings.DYNAMODB_TABLE_NAME)
-                await table.put_item(Item=serialized_item)
+            await cls._item_call("put_item", Item=serialized_item)
             
-            logger.info(f"Video metadata created: {video_data.filename} (ID: {video_id})")
+            logger.info("Video metadata created: %s (ID: %s)", video_data.filename, video_id)
             
             # Return the created item as VideoMetadata
             return VideoMetadata(
@@ -245,77 +474,75 @@ class DynamoDBService:
             )
             
         except ClientError as e:
-            logger.error(f"Failed to create video metadata: {e}")
+            logger.error("Failed to create video metadata: %s", e)
             raise
     
     @classmethod
-    async def update_video(cls, video_id: str, update_data: VideoUpdateRequest) -> Optional[VideoMetadata]:
+    async def update_video(
+        cls,
+        video_id: str,
+        update_data: VideoUpdateRequest,
+        return_updated: bool = True
+    ) -> Optional[VideoMetadata]:
         """
-        Update video metadata by ID.
+        Update video metadata by ID with a single UpdateItem call.
         
         Args:
             video_id: The video ID.
             update_data: Object containing fields to update.
+            return_updated: Whether to fetch the updated item back. When False,
+                DynamoDB returns no attributes and None is returned.
             
         Returns:
-            Optional[VideoMetadata]: The updated object, or None if not found.
+            Optional[VideoMetadata]: The updated object, or None if not found
+            (or not requested).
         """
         try:
-            session = cls._get_session()
-            client_kwargs = cls._get_client_kwargs()
-            
             # Filter out None values
-            update_dict = {k: v for k, v in update_data.model_dump().items() if v is not None}
+            # The request model is flat, so its __dict__ already holds the field values
+            update_dict = {k: v for k, v in update_data.__dict__.items() if v is not None}
             
             if not update_dict:
-                return await cls.get_video(video_id)
+                # Nothing to write: only read the item back if the caller wants it
+                # (get_video is usually served from the item cache)
+                return await cls.get_video(video_id) if return_updated else None
             
             update_dict["updated_at"] = datetime.now().isoformat()
             
-            # Build update expression
-            update_expression_parts = []
-            expression_attribute_names = {}
-            expression_attribute_values = {}
+            # Only the values differ between updates of the same fields
+            update_expression, expression_attribute_names = _update_expression(tuple(update_dict))
+            expression_attribute_values = {
+                f":val{i}": cls._serialize_value(value) for i, value in enumerate(update_dict.values())
+            }
             
-            for i, (key, value) in enumerate(update_dict.items()):
-                attr_name = f"#attr{i}"
-                attr_value = f":val{i}"
-                update_expression_parts.append(f"{attr_name} = {attr_value}")
-                expression_attribute_names[attr_name] = key
-                
-                # Serialize value
-                if isinstance(value, float):
-                    expression_attribute_values[attr_value] = Decimal(str(value))
-                elif isinstance(value, VideoStatus):
-                    expression_attribute_values[attr_value] = value.value
-                else:
-                    expression_attribute_values[attr_value] = value
+            response = await cls._item_call(
+                "update_item",
+                Key={"videoId": {"S": video_id}},
+                UpdateExpression=update_expression,
+                ExpressionAttributeNames=expression_attribute_names,
+                ExpressionAttributeValues=expression_attribute_values,
+                ReturnValues="ALL_NEW" if return_updated else "NONE"
+            )
             
-            update_expression = "SET " + ", ".join(update_expression_parts)
+            cls._item_cache.pop(video_id, None)
             
-            async with session.resource("dynamodb", **client_kwargs) as dynamodb:
-                table = await dynamodb.Table(settings.DYNAMODB_TABLE_NAME)
-                
-                response = await table.update_item(
-                    Key={"videoId": video_id},
-                    UpdateExpression=update_expression,
-                    ExpressionAttributeNames=expression_attribute_names,
-                    ExpressionAttributeValues=expression_attribute_values,
-                    ReturnValues="ALL_NEW"
-                )
+            if not return_updated:
+                logger.info("Video metadata updated: ID %s", video_id)
+                return None
             
             if response.get("Attributes"):
-                logger.info(f"Video metadata updated: ID {video_id}")
+                logger.info("Video metadata updated: ID %s", video_id)
                 item = cls._deserialize_item(response["Attributes"])
+                cls._cache_item(item)
                 return VideoMetadata(**item)
             
             return None
             
         except ClientError as e:
             if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
-                logger.warning(f"Video not found for update: ID {video_id}")
+                logger.warning("Video not found for update: ID %s", video_id)
                 return None
-            logger.error(f"Failed to update video metadata: {e}")
+            logger.error("Failed to update video metadata: %s", e)
             raise
     
     @classmethod
@@ -323,54 +550,115 @@ class DynamoDBService:
         """
         Retrieve video metadata by ID.
         
+        Results are cached for DYNAMODB_ITEM_CACHE_TTL seconds; updates and
+        deletes through this service invalidate the entry.
+        
         Args:
             video_id: The video ID.
             
         Returns:
             Optional[VideoMetadata]: The video object, or None if not found.
         """
+        item = cls._cached_item(video_id)
+        if item:
+            return VideoMetadata(**item)
+        
         try:
-            session = cls._get_session()
-            client_kwargs = cls._get_client_kwargs()
-            
-            async with session.resource("dynamodb", **client_kwargs) as dynamodb:
-                table = await dynamodb.Table(settings.DYNAMODB_TABLE_NAME)
-                response = await table.get_item(Key={"videoId": video_id})
+            response = await cls._item_call("get_item", Key={"videoId": {"S": video_id}})
             
             if "Item" in response:
                 item = cls._deserialize_item(response["Item"])
+                cls._cache_item(item)
                 return VideoMetadata(**item)
             
             return None
             
         except ClientError as e:
-            logger.error(f"Failed to retrieve video metadata: {e}")
+            logger.error("Failed to retrieve video metadata: %s", e)
             raise
     
     @classmethod
-    async def get_video_by_filename(cls, filename: str) -> Optional[VideoMetadata]:
+    async def get_videos_batch(cls, video_ids: List[str]) -> List[VideoMetadata]:
+        """
+        Retrieve several videos by ID using BatchGetItem.
+        
+        Args:
+            video_ids: The video IDs to fetch.
+            
+        Returns:
+            List[VideoMetadata]: Found videos, in the order of the requested IDs.
+        """
+        try:
+            unique_ids = list(dict.fromkeys(video_ids))
+            items = {}
+            
+            dynamodb = await cls._get_client()
+            
+            for i in range(0, len(unique_ids), BATCH_GET_MAX_KEYS):
+                request_items = {
+                    settings.DYNAMODB_TABLE_NAME: {
+                        "Keys": [{"videoId": {"S": video_id}} for video_id in unique_ids[i:i + BATCH_GET_MAX_KEYS]]
+                    }
+                }
+                
+                for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+                    response = await dynamodb.batch_get_item(RequestItems=request_items)
+                    
+                    for item in response.get("Responses", {}).get(settings.DYNAMODB_TABLE_NAME, []):
+                        item = cls._deserialize_item(item)
+                        items[item["videoId"]] = item
+                    
+                    request_items = response.get("UnprocessedKeys")
+                    if not request_items:
+                        break
+                    
+                    # Back off before retrying throttled keys
+                    await asyncio.sleep(0.05 * (2 ** attempt))
+                else:
+                    logger.warning("Some keys were left unprocessed by BatchGetItem")
+            
+            return [
+                VideoMetadata(**items[video_id])
+                for video_id in unique_ids
+                if video_id in items
+            ]
+            
+        except ClientError as e:
+            logger.error("Failed to batch retrieve video metadata: %s", e)
+            raise
+    
+    @classmethod
+    def _projection_kwargs(cls, fields: Optional[List[str]]) -> Dict[str, Any]:
+        """Get query/scan kwargs reading only the given fields (all fields if None)."""
+        return _projection(tuple(fields)) if fields else {}
+    
+    @classmethod
+    async def get_video_by_filename(
+        cls,
+        filename: str,
+        fields: Optional[List[str]] = None
+    ) -> Optional[VideoMetadata]:
         """
         Retrieve video metadata by filename using GSI.
         
         Args:
             filename: The exact filename to search for.
+            fields: Attributes to read (required ones are always included); all if None.
             
         Returns:
             Optional[VideoMetadata]: The video object, or None if not found.
         """
         try:
-            session = cls._get_session()
-            client_kwargs = cls._get_client_kwargs()
-            
-            async with session.resource("dynamodb", **client_kwargs) as dynamodb:
-                table = await dynamodb.Table(settings.DYNAMODB_TABLE_NAME)
-                
-                response = await table.query(
-                    IndexName="filename-index",
-                    KeyConditionExpression="filename = :filename",
-                    ExpressionAttributeValues={":filename": filename},
-                    Limit=1
-                )
+            dynamodb = await cls._get_client()
+            
+            response = await dynamodb.query(
+                TableName=settings.DYNAMODB_TABLE_NAME,
+                IndexName="filename-index",
+                KeyConditionExpression="filename = :filename",
+                ExpressionAttributeValues={":filename": {"S": filename}},
+                Limit=1,
+                **cls._projection_kwargs(fields)
+            )
             
             items = response.get("Items", [])
             if items:
@@ -380,95 +668,224 @@ class DynamoDBService:
             return None
             
         except ClientError as e:
-            logger.error(f"Failed to retrieve video by filename: {e}")
+            logger.error("Failed to retrieve video by filename: %s", e)
             raise
     
     @classmethod
-    async def get_video_by_source_id(cls, source_video_id: str) -> Optional[VideoMetadata]:
+    async def get_video_by_source_id(
+        cls,
+        source_video_id: str,
+        fields: Optional[List[str]] = None
+    ) -> Optional[VideoMetadata]:
         """
         Retrieve video metadata by source video ID using GSI.
         
+        Full (unprojected) results share the get_video cache.
+        
         Args:
             source_video_id: The video ID from vidp-fastapi-service.
+            fields: Attributes to read (required ones are always included); all if None.
             
         Returns:
             Optional[VideoMetadata]: The video object, or None if not found.
         """
+        if not fields and source_video_id in cls._source_ids:
+            item = cls._cached_item(cls._source_ids[source_video_id])
+            if item and item.get("source_video_id") == source_video_id:
+                return VideoMetadata(**item)
+        
         try:
-            session = cls._get_session()
-            client_kwargs = cls._get_client_kwargs()
+            dynamodb = await cls._get_client()
             
-            async with session.resource("dynamodb", **client_kwargs) as dynamodb:
-                table = await dynamodb.Table(settings.DYNAMODB_TABLE_NAME)
-                
-                response = await table.query(
+            if await cls._source_index_active(dynamodb):
+                response = await dynamodb.query(
+                    TableName=settings.DYNAMODB_TABLE_NAME,
                     IndexName="source_video_id-index",
                     KeyConditionExpression="source_video_id = :source_id",
-                    ExpressionAttributeValues={":source_id": source_video_id},
-                    Limit=1
+                    ExpressionAttributeValues={":source_id": {"S": source_video_id}},
+                    Limit=1,
+                    **cls._projection_kwargs(fields)
                 )
+                items = response.get("Items", [])
+            else:
+                items = await cls._scan_for_source_id(dynamodb, source_video_id, fields)
             
-            items = response.get("Items", [])
             if items:
-                logger.info(f"Found video with source_video_id: {source_video_id}")
+                logger.info("Found video with source_video_id: %s", source_video_id)
                 item = cls._deserialize_item(items[0])
+                if not fields:
+                    cls._cache_item(item)
                 return VideoMetadata(**item)
             
             return None
             
         except ClientError as e:
-            logger.error(f"Failed to retrieve video by source_video_id: {e}")
+            logger.error("Failed to retrieve video by source_video_id: %s", e)
             raise
     
+    @classmethod
+    async def _scan_for_source_id(
+        cls,
+        dynamodb,
+        source_video_id: str,
+        fields: Optional[List[str]] = None
+    ) -> List[dict]:
+        """Scan the table for a source_video_id, stopping at the first page with a match."""
+        scan_kwargs = {
+            "TableName": settings.DYNAMODB_TABLE_NAME,
+            "FilterExpression": "source_video_id = :source_id",
+            "ExpressionAttributeValues": {":source_id": {"S": source_video_id}},
+            **cls._projection_kwargs(fields)
+        }
+        while True:
+            response = await dynamodb.scan(**scan_kwargs)
+            if response.get("Items") or not response.get("LastEvaluatedKey"):
+                return response.get("Items", [])
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+    
     @classmethod
     async def list_videos(
         cls,
         status: Optional[VideoStatus] = None,
-        limit: int = 100
-    ) -> List[VideoMetadata]:
+        limit: int = 100,
+        start_key: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[VideoMetadata], Optional[Dict[str, Any]]]:
         """
-        List videos with optional status filter.
+        List one page of videos with optional status filter.
         
         Args:
             status: Filter by processing status.
             limit: Maximum number of records to return.
+            start_key: Key returned with the previous page, to continue from it.
+            fields: Attributes to read (required ones are always included); all if None.
             
         Returns:
-            List[VideoMetadata]: A list of video objects.
+            Tuple[List[VideoMetadata], Optional[Dict[str, Any]]]: The video objects and
+            the key to pass as start_key for the next page (None on the last page).
         """
         try:
-            session = cls._get_session()
-            client_kwargs = cls._get_client_kwargs()
-            
-            async with session.resource("dynamodb", **client_kwargs) as dynamodb:
-                table = await dynamodb.Table(settings.DYNAMODB_TABLE_NAME)
-                
-                if status:
-                    # Use GSI for status filtering
-                    response = await table.query(
-                        IndexName="status-created_at-index",
-                        KeyConditionExpression="status = :status",
-                        ExpressionAttributeValues={":status": status.value},
-                        ScanIndexForward=False,  # Sort descending by created_at
-                        Limit=limit
-                    )
-                else:
-                    # Scan all items (less efficient but necessary without status filter)
-                    response = await table.scan(Limit=limit)
-            
-            items = response.get("Items", [])
-            videos = [VideoMetadata(**cls._deserialize_item(item)) for item in items]
-            
-            # Sort by created_at if we did a scan
             if not status:
-                videos.sort(key=lambda v: v.created_at, reverse=True)
+                videos, next_key = await cls._scan_segments(limit, start_key, fields)
+            else:
+                page_kwargs = {"Limit": limit, **cls._projection_kwargs(fields)}
+                if start_key:
+                    page_kwargs["ExclusiveStartKey"] = start_key
+                
+                dynamodb = await cls._get_client()
+                
+                # Use GSI for status filtering
+                response = await dynamodb.query(
+                    TableName=settings.DYNAMODB_TABLE_NAME,
+                    IndexName="status-created_at-index",
+                    KeyConditionExpression="status = :status",
+                    ExpressionAttributeValues={":status": {"S": status.value}},
+                    ScanIndexForward=False,  # Sort descending by created_at
+                    **page_kwargs
+                )
+                videos = [VideoMetadata(**cls._deserialize_item(item)) for item in response.get("Items", [])]
+                next_key = response.get("LastEvaluatedKey")
             
-            return videos
+            return videos, next_key
             
         except ClientError as e:
-            logger.error(f"Failed to list videos: {e}")
+            logger.error("Failed to list videos: %s", e)
             raise
     
+    @classmethod
+    def is_valid_page_key(cls, start_key: Dict[str, Any], status: Optional[VideoStatus] = None) -> bool:
+        """
+        Check that a start_key has the shape list_videos returns for the same listing.
+        
+        Status pages continue from a status-created_at-index key (videoId, status,
+        created_at) of that status; unfiltered pages from a map of scan segment
+        numbers to {} or a table key (videoId). DynamoDB rejects other keys with a
+        ValidationException.
+        
+        Args:
+            start_key: Decoded page key.
+            status: Status filter of the listing.
+            
+        Returns:
+            bool: True if the key can be passed to list_videos.
+        """
+        def is_string(value: Any) -> bool:
+            return isinstance(value, dict) and value.keys() == {"S"} and isinstance(value["S"], str)
+        
+        if status:
+            return (
+                start_key.keys() == {"videoId", "status", "created_at"}
+                and all(is_string(value) for value in start_key.values())
+                and start_key["status"]["S"] == status.value
+            )
+        
+        return all(
+            segment.isdigit() and (key == {} or (key.keys() == {"videoId"} and is_string(key["videoId"])))
+            for segment, key in start_key.items()
+        )
+    
+    @classmethod
+    async def _scan_segments(
+        cls,
+        limit: int,
+        start_key: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[VideoMetadata], Optional[Dict[str, Any]]]:
+        """
+        Scan one page of the table as DYNAMODB_SCAN_SEGMENTS parallel segments.
+        
+        The page key maps each unfinished segment number (as a string) to its
+        LastEvaluatedKey, or to {} if the segment has not been read yet.
+        
+        Args:
+            limit: Maximum number of records to return, split across segments.
+            start_key: Key returned with the previous page.
+            fields: Attributes to read; all if None.
+            
+        Returns:
+            Tuple[List[VideoMetadata], Optional[Dict[str, Any]]]: The videos, newest
+            first, and the key for the next page (None once every segment is done).
+        """
+        total_segments = settings.DYNAMODB_SCAN_SEGMENTS
+        if start_key is None:
+            pending = {str(i): {} for i in range(total_segments)}
+        else:
+            # Ignore entries that are not segments of the current scan layout
+            pending = {
+                segment: key for segment, key in start_key.items()
+                if segment.isdigit() and int(segment) < total_segments
+            }
+        
+        # Share the limit across as many pending segments as it allows
+        segments = list(pending)[:limit]
+        share, extra = divmod(limit, len(segments)) if segments else (0, 0)
+        
+        dynamodb = await cls._get_client()
+        
+        async def scan(index: int, segment: str) -> dict:
+            scan_kwargs = {"Limit": share + (index < extra), **cls._projection_kwargs(fields)}
+            if pending[segment]:
+                scan_kwargs["ExclusiveStartKey"] = pending[segment]
+            return await dynamodb.scan(
+                TableName=settings.DYNAMODB_TABLE_NAME,
+                Segment=int(segment),
+                TotalSegments=total_segments,
+                **scan_kwargs
+            )
+        
+        responses = await asyncio.gather(*(scan(i, segment) for i, segment in enumerate(segments)))
+        
+        # Segments read now go to the back, so small pages rotate through all of them
+        next_key = {segment: key for segment, key in pending.items() if segment not in segments}
+        videos = []
+        for segment, response in zip(segments, responses):
+            videos.extend(VideoMetadata(**cls._deserialize_item(item)) for item in response.get("Items", []))
+            if response.get("LastEvaluatedKey"):
+                next_key[segment] = response["LastEvaluatedKey"]
+        
+        videos.sort(key=lambda v: v.created_at, reverse=True)
+        return videos, next_key or None
+    
     @classmethod
     async def delete_video(cls, video_id: str) -> bool:
         """
@@ -481,43 +898,43 @@ class DynamoDBService:
             bool: True if the document was deleted.
         """
         try:
-            session = cls._get_session()
-            client_kwargs = cls._get_client_kwargs()
-            
-            async with session.resource("dynamodb", **client_kwargs) as dynamodb:
-                table = await dynamodb.Table(settings.DYNAMODB_TABLE_NAME)
-                
-                # Check if item exists first
-                response = await table.delete_item(
-                    Key={"videoId": video_id},
-                    ReturnValues="ALL_OLD"
-                )
+            # The condition tells whether the item existed, without returning it
+            await cls._item_call(
+                "delete_item",
+                Key={"videoId": {"S": video_id}},
+                ConditionExpression="attribute_exists(videoId)"
+            )
             
-            if response.get("Attributes"):
-                logger.info(f"Video metadata deleted: ID {video_id}")
-                return True
-            else:
-                logger.warning(f"Video not found for deletion: ID {video_id}")
-                return False
+            cls._item_cache.pop(video_id, None)
+            logger.info("Video metadata deleted: ID %s", video_id)
+            return True
             
         except ClientError as e:
-            logger.error(f"Failed to delete video metadata: {e}")
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                cls._item_cache.pop(video_id, None)
+                logger.warning("Video not found for deletion: ID %s", video_id)
+                return False
+            logger.error("Failed to delete video metadata: %s", e)
             raise
     
     @classmethod
     async def is_connected(cls) -> bool:
         """
-        Check if DynamoDB is accessible.
+        Check if DynamoDB is accessible, caching the answer for TABLE_CHECK_CACHE_TTL
+        seconds so frequent health checks do not each hit DynamoDB.
         
         Returns:
             bool: True if connected and table exists.
         """
+        if cls._table_check and cls._table_check[1] > time.monotonic():
+            return cls._table_check[0]
+        
         try:
-            session = cls._get_session()
-            client_kwargs = cls._get_client_kwargs()
-            
-            async with session.client("dynamodb", **client_kwargs) as dynamodb:
-                await dynamodb.describe_table(TableName=settings.DYNAMODB_TABLE_NAME)
-            return True
+            dynamodb = await cls._get_client()
+            await dynamodb.describe_table(TableName=settings.DYNAMODB_TABLE_NAME)
+            connected = True
         except Exception:
-            return False
+            connected = False
+        
+        cls._table_check = (connected, time.monotonic() + TABLE_CHECK_CACHE_TTL)
+        return connected
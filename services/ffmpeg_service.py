@@ -7,25 +7,44 @@ Handles video manipulation tasks including subtitle burning and metadata extract
 
 import asyncio
 import logging
-import json
 import subprocess
 import os
-import shutil
-import tempfile
 import ctypes
-from pathlib import Path
-from typing import Optional, Dict, Any
+import itertools
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
+
+import orjson
 
 from config.settings import settings
 from utils.exceptions import FFmpegError
 
 logger = logging.getLogger(__name__)
 
+# Bytes of FFmpeg stderr kept for the error report (its last 20 lines)
+FFMPEG_LOG_TAIL_BYTES = 64 * 1024
+
+# Default quality; an explicitly requested other CRF always re-encodes
+DEFAULT_CRF = 23
+
+# FFMPEG_LOW_MEMORY options per CPU encoder: each one's way of dropping its
+# frame lookahead (other encoders get none)
+LOW_MEMORY_CODEC_ARGS = {
+    "libx264": ["-tune", "zerolatency"],
+    "libx265": ["-tune", "zerolatency"],
+    "libvpx": ["-lag-in-frames", "0"],
+    "libvpx-vp9": ["-lag-in-frames", "0"],
+    "libaom-av1": ["-lag-in-frames", "0"],
+}
+
 class FFmpegService:
     """
     Handles FFmpeg operations for video processing.
     """
 
+    _gpu_encoder_available: Optional[bool] = None
+    _gpu_cycle = itertools.cycle(settings.FFMPEG_GPU_DEVICES)
+
     @staticmethod
     def _validate_srt_content(srt_path: str) -> bool:
         """
@@ -35,11 +54,15 @@ class FFmpegService:
             bool: True if the SRT has content, False if empty/invalid (will skip subtitle burning)
         """
         try:
-            with open(srt_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(1024).strip()
+            # An empty file needs no open/read
+            if os.stat(srt_path).st_size == 0:
+                content = ''
+            else:
+                with open(srt_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    content = f.read(1024).strip()
             
             if not content:
-                logger.info(f"SRT file is empty: {srt_path} - will process video without subtitles")
+                logger.info("SRT file is empty: %s - will process video without subtitles", srt_path)
                 return False
 
             if content.startswith('{') and '"status":' in content:
@@ -49,10 +72,10 @@ class FFmpegService:
             return True
 
         except FileNotFoundError:
-            logger.warning(f"SRT file missing during validation: {srt_path} - will process video without subtitles")
+            logger.warning("SRT file missing during validation: %s - will process video without subtitles", srt_path)
             return False
         except Exception as e:
-            logger.warning(f"Skipping strict SRT validation due to read error: {e} - will process video without subtitles")
+            logger.warning("Skipping strict SRT validation due to read error: %s - will process video without subtitles", e)
             return False
 
     @staticmethod
@@ -61,22 +84,43 @@ class FFmpegService:
         Converts a Windows path with spaces to a DOS 8.3 short path.
         Example: "D:/My Folder/File.txt" -> "D:/MYFOLD~1/File.txt"
         This eliminates spaces, making the path safe for FFmpeg filters.
+        
+        Only the directory is looked up (and cached) when the file name itself
+        has no spaces, since jobs keep writing new files to the same directories.
         """
         if os.name != 'nt':
             return long_path
 
+        directory, name = os.path.split(long_path)
+        if ' ' in name or not directory:
+            return FFmpegService._short_path_name(long_path)
+        return os.path.join(FFmpegService._short_directory_name(directory), name)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _short_directory_name(directory: str) -> str:
+        """Cached short path of a directory."""
+        return FFmpegService._short_path_name(directory)
+
+    @staticmethod
+    def _short_path_name(long_path: str) -> str:
+        """
+        Call GetShortPathNameW, querying the buffer size only if MAX_PATH is too small.
+        """
         try:
-            # Prepare buffer for the short path
-            output_buf_size = ctypes.windll.kernel32.GetShortPathNameW(long_path, None, 0)
-            if output_buf_size == 0:
+            output_buf = ctypes.create_unicode_buffer(520)
+            length = ctypes.windll.kernel32.GetShortPathNameW(long_path, output_buf, len(output_buf))
+            if length == 0:
                 # If conversion fails, return original (might be already short or invalid)
                 return long_path
-                
-            output_buf = ctypes.create_unicode_buffer(output_buf_size)
-            ctypes.windll.kernel32.GetShortPathNameW(long_path, output_buf, output_buf_size)
+            
+            if length > len(output_buf):
+                # The return value is the required size, including the terminator
+                output_buf = ctypes.create_unicode_buffer(length)
+                ctypes.windll.kernel32.GetShortPathNameW(long_path, output_buf, length)
             return output_buf.value
         except Exception as e:
-            logger.warning(f"Failed to convert to short path: {e}")
+            logger.warning("Failed to convert to short path: %s", e)
             return long_path
 
     @staticmethod
@@ -114,8 +158,9 @@ class FFmpegService:
                 file_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
+            # ffprobe output stays bytes: orjson parses it without a str decode
+            result = subprocess.run(cmd, capture_output=True, check=True)
+            data = orjson.loads(result.stdout)
             
             format_info = data.get('format', {})
             video_stream = next((s for s in data.get('streams', []) if s['codec_type'] == 'video'), {})
@@ -127,7 +172,7 @@ class FFmpegService:
                 'codec': video_stream.get('codec_name')
             }
         except Exception as e:
-            logger.error(f"Metadata extraction failed: {str(e)}")
+            logger.error("Metadata extraction failed: %s", e)
             return {
                 "resolution": "unknown",
                 "duration": 0.0,
@@ -135,151 +180,364 @@ class FFmpegService:
                 "codec": "unknown"
             }
 
+    @staticmethod
+    def _build_command(
+        video_path: str,
+        output_path: str,
+        resolution: Tuple[int, int],
+        crf: int,
+        preset: str,
+        subtitle_filter: Optional[str] = None,
+        use_gpu: bool = False,
+        extra_outputs: Optional[List[Tuple[Tuple[int, int], str]]] = None
+    ) -> List[str]:
+        """
+        Build the FFmpeg command line for a single encode.
+        
+        With extra_outputs, the command produces every rendition from one decode
+        (see _build_renditions_command).
+        
+        The GPU variant decodes with CUDA and encodes with NVENC on the next GPU of
+        FFMPEG_GPU_DEVICES (round-robin, so concurrent jobs spread over all
+        NVDEC/NVENC engines of a multi-GPU host). Without subtitles,
+        frames stay in VRAM and are scaled on the GPU. With subtitles and
+        FFMPEG_GPU_SUBTITLE_OVERLAY, libass only renders onto a transparent layer
+        that is uploaded and composited with overlay_cuda, so the video itself
+        never leaves VRAM; otherwise FFmpeg downloads every decoded frame for the
+        CPU subtitles filter.
+        """
+        if extra_outputs:
+            return FFmpegService._build_renditions_command(
+                video_path, [(resolution, output_path), *extra_outputs], crf, preset, subtitle_filter, use_gpu
+            )
+        
+        scale = f"{resolution[0]}:{resolution[1]}"
+        
+        if use_gpu:
+            gpu = str(next(FFmpegService._gpu_cycle))
+            
+            if subtitle_filter and settings.FFMPEG_GPU_SUBTITLE_OVERLAY:
+                # Decoder and hwupload share one named CUDA device; overlay_cuda
+                # blends a yuva420p layer onto a yuv420p main stream
+                size = f"{resolution[0]}x{resolution[1]}"
+                cmd = [
+                    'ffmpeg', '-y',
+                    '-init_hw_device', f'cuda=gpu:{gpu}',
+                    '-filter_hw_device', 'gpu',
+                    '-hwaccel', 'cuda',
+                    '-hwaccel_device', 'gpu',
+                    '-hwaccel_output_format', 'cuda',
+                    '-i', video_path,
+                    '-filter_complex', (
+                        f"[0:v]{settings.FFMPEG_GPU_SCALE_FILTER}={scale}:format=yuv420p[base];"
+                        f"color=c=black@0:s={size},format=yuva420p,{subtitle_filter}:alpha=1,hwupload[subs];"
+                        f"[base][subs]overlay_cuda=shortest=1[v]"
+                    ),
+                    '-map', '[v]',
+                    '-map', '0:a?'
+                ]
+            elif subtitle_filter:
+                cmd = [
+                    'ffmpeg', '-y', '-hwaccel', 'cuda', '-hwaccel_device', gpu,
+                    '-i', video_path,
+                    '-vf', f"{subtitle_filter},scale={scale}"
+                ]
+            else:
+                cmd = [
+                    'ffmpeg', '-y', '-hwaccel', 'cuda', '-hwaccel_device', gpu,
+                    '-hwaccel_output_format', 'cuda',
+                    '-i', video_path,
+                    '-vf', f"{settings.FFMPEG_GPU_SCALE_FILTER}={scale}"
+                ]
+            
+            return cmd + [
+                '-c:v', settings.FFMPEG_GPU_CODEC,
+                '-gpu', gpu,
+                '-preset', settings.FFMPEG_GPU_PRESET,
+                '-tune', settings.FFMPEG_GPU_TUNE,
+                '-rc', 'vbr',
+                '-cq', str(crf),
+                '-b:v', '0',
+                *(['-rc-lookahead', '0'] if settings.FFMPEG_LOW_MEMORY else []),
+                '-c:a', 'aac',
+                '-b:a', '128k',
+                output_path
+            ]
+        
+        vf_filter = f"{subtitle_filter},scale={scale}" if subtitle_filter else f"scale={scale}"
+        
+        return [
+            'ffmpeg',
+            '-y',
+            '-i', video_path,
+            '-vf', vf_filter,
+            '-c:v', settings.FFMPEG_CODEC,
+            '-crf', str(crf),
+            '-preset', preset,
+            *(LOW_MEMORY_CODEC_ARGS.get(settings.FFMPEG_CODEC, []) if settings.FFMPEG_LOW_MEMORY else []),
+            '-c:a', 'aac',
+            '-b:a', '128k',
+            output_path
+        ]
+
+    @staticmethod
+    def _build_renditions_command(
+        video_path: str,
+        outputs: List[Tuple[Tuple[int, int], str]],
+        crf: int,
+        preset: str,
+        subtitle_filter: Optional[str] = None,
+        use_gpu: bool = False
+    ) -> List[str]:
+        """
+        Build one FFmpeg command encoding several resolutions from a single decode.
+        
+        Subtitles are burned once before the stream is split, then every branch is
+        scaled and encoded to its own file. On the GPU path without subtitles the
+        frames stay in VRAM through the split, scaling and encoding.
+        """
+        if use_gpu:
+            gpu = str(next(FFmpegService._gpu_cycle))
+            cmd = ['ffmpeg', '-y', '-hwaccel', 'cuda', '-hwaccel_device', gpu]
+            
+            if subtitle_filter:
+                scale_filter = 'scale'
+            else:
+                cmd += ['-hwaccel_output_format', 'cuda']
+                scale_filter = settings.FFMPEG_GPU_SCALE_FILTER
+            
+            codec_args = [
+                '-c:v', settings.FFMPEG_GPU_CODEC,
+                '-gpu', gpu,
+                '-preset', settings.FFMPEG_GPU_PRESET,
+                '-tune', settings.FFMPEG_GPU_TUNE,
+                '-rc', 'vbr',
+                '-cq', str(crf),
+                '-b:v', '0'
+            ]
+            if settings.FFMPEG_LOW_MEMORY:
+                codec_args += ['-rc-lookahead', '0']
+        else:
+            cmd = ['ffmpeg', '-y']
+            scale_filter = 'scale'
+            codec_args = ['-c:v', settings.FFMPEG_CODEC, '-crf', str(crf), '-preset', preset]
+            if settings.FFMPEG_LOW_MEMORY:
+                codec_args += LOW_MEMORY_CODEC_ARGS.get(settings.FFMPEG_CODEC, [])
+        
+        # e.g. [0:v]subtitles=...,split=2[s0][s1];[s0]scale=1280:720[v0];[s1]scale=640:360[v1]
+        graph = f"[0:v]{subtitle_filter + ',' if subtitle_filter else ''}split={len(outputs)}"
+        graph += "".join(f"[s{i}]" for i in range(len(outputs)))
+        for i, ((width, height), _) in enumerate(outputs):
+            graph += f";[s{i}]{scale_filter}={width}:{height}[v{i}]"
+        
+        cmd += ['-i', video_path, '-filter_complex', graph]
+        
+        for i, (_, output_path) in enumerate(outputs):
+            cmd += ['-map', f'[v{i}]', '-map', '0:a?', *codec_args, '-c:a', 'aac', '-b:a', '128k', output_path]
+        
+        return cmd
+
+    @staticmethod
+    async def _is_gpu_encoder_available() -> bool:
+        """
+        Check once whether the installed FFmpeg ships the configured NVENC encoder.
+        """
+        if FFmpegService._gpu_encoder_available is None:
+            try:
+                result = await asyncio.to_thread(
+                    subprocess.run,
+                    ['ffmpeg', '-hide_banner', '-encoders'],
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+                available = settings.FFMPEG_GPU_CODEC in result.stdout
+            except Exception as e:
+                logger.warning("Failed to list FFmpeg encoders: %s", e)
+                available = False
+            
+            if not available:
+                logger.warning("%s is not available, using %s", settings.FFMPEG_GPU_CODEC, settings.FFMPEG_CODEC)
+            FFmpegService._gpu_encoder_available = available
+        
+        return FFmpegService._gpu_encoder_available
+
+    @staticmethod
+    async def _run_ffmpeg(cmd: List[str], output_path: str) -> None:
+        """
+        Execute an FFmpeg command and verify the output file was produced.
+        
+        Raises:
+            FFmpegError: If FFmpeg exits with an error or produces no output.
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+
+            # Only the end of the log is reported: drain stderr in chunks (progress
+            # lines end in \r, not \n) and keep a bounded tail instead of the whole log
+            stderr_tail = bytearray()
+            
+            async def drain_stderr() -> None:
+                while chunk := await process.stderr.read(65536):
+                    stderr_tail.extend(chunk)
+                    del stderr_tail[:-FFMPEG_LOG_TAIL_BYTES]
+            
+            await asyncio.gather(drain_stderr(), process.wait())
+            
+            if process.returncode != 0:
+                logger.error("FFmpeg Exit Code: %s", process.returncode)
+                error_log = stderr_tail.decode('utf-8', errors='replace')
+                tail_log = '\n'.join(error_log.splitlines()[-20:])
+                logger.error("FFmpeg Log Tail:\n%s", tail_log)
+                raise FFmpegError(f"FFmpeg processing failed: {tail_log}")
+                
+            if not os.path.exists(output_path):
+                raise FFmpegError("Output file missing after FFmpeg run")
+
+        except Exception as e:
+            if isinstance(e, FFmpegError):
+                raise
+            logger.error("FFmpeg execution failed: %s", e)
+            raise FFmpegError(f"FFmpeg execution failed: {str(e)}")
+
+    @staticmethod
+    async def _encode(
+        video_path: str,
+        output_path: str,
+        resolution: Tuple[int, int],
+        crf: int,
+        preset: str,
+        use_gpu: bool,
+        subtitle_filter: Optional[str] = None,
+        extra_outputs: Optional[List[Tuple[Tuple[int, int], str]]] = None
+    ) -> None:
+        """
+        Encode with NVENC when requested and available, falling back to the CPU encoder on failure.
+        """
+        if use_gpu and await FFmpegService._is_gpu_encoder_available():
+            cmd = FFmpegService._build_command(
+                video_path, output_path, resolution, crf, preset, subtitle_filter,
+                use_gpu=True, extra_outputs=extra_outputs
+            )
+            try:
+                await FFmpegService._run_ffmpeg(cmd, output_path)
+                return
+            except FFmpegError as e:
+                logger.warning("GPU encoding failed, falling back to %s: %s", settings.FFMPEG_CODEC, e)
+        
+        cmd = FFmpegService._build_command(
+            video_path, output_path, resolution, crf, preset, subtitle_filter, extra_outputs=extra_outputs
+        )
+        await FFmpegService._run_ffmpeg(cmd, output_path)
+
     @staticmethod
     async def burn_subtitles(
         video_path: str,
-        srt_path: str,
+        srt_path: Optional[str],
         output_path: str,
-        resolution: str = "1280x720",
-        crf: int = 23,
-        preset: Optional[str] = None
+        resolution: Tuple[int, int] = (1280, 720),
+        crf: int = DEFAULT_CRF,
+        preset: Optional[str] = None,
+        use_gpu: Optional[bool] = None,
+        extra_outputs: Optional[List[Tuple[Tuple[int, int], str]]] = None
     ) -> None:
         """
         Burn subtitles into video using FFmpeg.
         
-        If the SRT file is empty or invalid, the video will be processed without subtitles.
+        extra_outputs lists additional (resolution, output_path) renditions that are
+        encoded by the same FFmpeg run, sharing a single decode and subtitle pass.
+        
+        If srt_path is None or the SRT file is empty/invalid, the video is processed
+        without subtitles; when it already is H.264 at the target resolution and
+        the default CRF is requested, the video stream is copied as-is instead of
+        being re-encoded (audio is still converted to 128k AAC, as when encoding). If the copy fails, the
+        video is re-encoded as usual.
+        When use_gpu is enabled (defaults to FFMPEG_USE_GPU), decoding and encoding
+        run on an NVIDIA GPU, with libx264 as a fallback.
         
         Strategy: Use Windows Short Paths (8.3) to bypass space/character issues
         and strictly escape the drive letter colon.
         """
         # 1. Resolve Absolute Paths
-        abs_video_path = str(Path(video_path).resolve())
-        abs_srt_path = str(Path(srt_path).resolve())
-        abs_output_path = str(Path(output_path).resolve())
+        # (pure string operations: symlinks need no resolving for FFmpeg)
+        abs_video_path = os.path.abspath(video_path)
+        abs_srt_path = os.path.abspath(srt_path) if srt_path else None
+        abs_output_path = os.path.abspath(output_path)
+        extra_outputs = [
+            (extra_resolution, os.path.abspath(extra_path))
+            for extra_resolution, extra_path in extra_outputs or []
+        ]
         
         if not os.path.exists(abs_video_path):
             raise FFmpegError(f"Video file not found: {abs_video_path}")
         
         # Check if SRT has valid content
-        has_subtitles = FFmpegService._validate_srt_content(abs_srt_path)
+        has_subtitles = abs_srt_path is not None and FFmpegService._validate_srt_content(abs_srt_path)
 
         preset = preset or settings.FFMPEG_PRESET
-        codec = settings.FFMPEG_CODEC
+        use_gpu = settings.FFMPEG_USE_GPU if use_gpu is None else use_gpu
 
         if has_subtitles:
             # Process with subtitles
-            # 2. Create a Temp SRT (Just to be safe and clean)
-            temp_srt_fd, temp_srt_path = tempfile.mkstemp(suffix='.srt', text=True)
-            os.close(temp_srt_fd)
-            
             try:
-                # Copy content to temp file
-                shutil.copy2(abs_srt_path, temp_srt_path)
-                
-                # 3. Get the "Safe" path (Short path + Escaped Colon)
-                # This turns "D:\M2 DS\temp.srt" into "D\:/M2DS~1/temp.srt"
-                filter_srt_path = FFmpegService._get_ffmpeg_safe_path(temp_srt_path)
+                # 2. Get the "Safe" path (Short path + Escaped Colon) of the SRT itself:
+                # it is only read, so there is no need to copy it to a temp file first.
+                # This turns "D:\M2 DS\job.srt" into "D\:/M2DS~1/job.srt"
+                filter_srt_path = FFmpegService._get_ffmpeg_safe_path(abs_srt_path)
 
-                vf_filter = (
-                    f"subtitles='{filter_srt_path}':force_style='Fontsize=24,PrimaryColour=&H00FFFFFF,BackColour=&H80000000,BorderStyle=3',"
-                    f"scale={resolution}"
+                subtitle_filter = (
+                    f"subtitles='{filter_srt_path}':force_style='Fontsize=24,PrimaryColour=&H00FFFFFF,BackColour=&H80000000,BorderStyle=3'"
                 )
 
-                cmd = [
-                    'ffmpeg',
-                    '-y',
-                    '-i', abs_video_path,
-                    '-vf', vf_filter,
-                    '-c:v', codec,
-                    '-crf', str(crf),
-                    '-preset', preset,
-                    '-c:a', 'aac',
-                    '-b:a', '128k',
-                    abs_output_path
-                ]
+                logger.info("Starting FFmpeg burn with subtitles: %s", os.path.basename(abs_video_path))
+                logger.debug("Subtitle Filter Path: %s", filter_srt_path)
 
-                logger.info(f"Starting FFmpeg burn with subtitles: {os.path.basename(abs_video_path)}")
-                logger.debug(f"Subtitle Filter Path: {filter_srt_path}")
-
-                # 4. Execute
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
+                # 3. Execute
+                await FFmpegService._encode(
+                    abs_video_path, abs_output_path, resolution, crf, preset, use_gpu, subtitle_filter, extra_outputs
                 )
-
-                stdout, stderr = await process.communicate()
-                
-                if process.returncode != 0:
-                    logger.error(f"FFmpeg Exit Code: {process.returncode}")
-                    error_log = stderr.decode('utf-8', errors='replace')
-                    tail_log = '\n'.join(error_log.splitlines()[-20:])
-                    logger.error(f"FFmpeg Log Tail:\n{tail_log}")
-                    raise FFmpegError(f"FFmpeg processing failed: {tail_log}")
                     
-                if not os.path.exists(abs_output_path):
-                    raise FFmpegError("Output file missing after FFmpeg run")
-                    
-                logger.info(f"Successfully burned subtitles: {os.path.basename(abs_output_path)}")
+                logger.info("Successfully burned subtitles: %s", os.path.basename(abs_output_path))
 
             except Exception as e:
                 if isinstance(e, FFmpegError):
                     raise
-                logger.error(f"FFmpeg execution failed: {str(e)}")
+                logger.error("FFmpeg execution failed: %s", e)
                 raise FFmpegError(f"FFmpeg execution failed: {str(e)}")
-            
-            finally:
-                # 5. Clean up temp SRT
-                if os.path.exists(temp_srt_path):
-                    try:
-                        os.remove(temp_srt_path)
-                    except OSError:
-                        pass
         else:
             # Process WITHOUT subtitles (video has no audio / empty SRT)
-            logger.info(f"Processing video WITHOUT subtitles: {os.path.basename(abs_video_path)}")
+            logger.info("Processing video WITHOUT subtitles: %s", os.path.basename(abs_video_path))
             
-            vf_filter = f"scale={resolution}"
-
-            cmd = [
-                'ffmpeg',
-                '-y',
-                '-i', abs_video_path,
-                '-vf', vf_filter,
-                '-c:v', codec,
-                '-crf', str(crf),
-                '-preset', preset,
-                '-c:a', 'aac',
-                '-b:a', '128k',
-                abs_output_path
-            ]
-
-            try:
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
+            if extra_outputs:
+                await FFmpegService._encode(
+                    abs_video_path, abs_output_path, resolution, crf, preset, use_gpu, None, extra_outputs
                 )
-
-                stdout, stderr = await process.communicate()
+                logger.info("Successfully processed %s renditions (no subtitles)", len(extra_outputs) + 1)
+                return
+            
+            source_info = await asyncio.to_thread(FFmpegService.get_video_metadata, abs_video_path)
+            
+            if (
+                crf == DEFAULT_CRF
+                and source_info.get("resolution") == f"{resolution[0]}x{resolution[1]}"
+                and source_info.get("codec") == "h264"
+            ):
+                # Nothing to burn or scale: copy the video stream without re-encoding
+                cmd = ['ffmpeg', '-y', '-i', abs_video_path, '-c:v', 'copy', '-c:a', 'aac', '-b:a', '128k', abs_output_path]
+                try:
+                    await FFmpegService._run_ffmpeg(cmd, abs_output_path)
+                    logger.info("Successfully copied video (no subtitles, no scaling): %s", os.path.basename(abs_output_path))
+                    return
+                except FFmpegError as e:
+                    logger.warning("Stream copy failed, re-encoding instead: %s", e)
+            
+            await FFmpegService._encode(abs_video_path, abs_output_path, resolution, crf, preset, use_gpu)
                 
-                if process.returncode != 0:
-                    logger.error(f"FFmpeg Exit Code: {process.returncode}")
-                    error_log = stderr.decode('utf-8', errors='replace')
-                    tail_log = '\n'.join(error_log.splitlines()[-20:])
-                    logger.error(f"FFmpeg Log Tail:\n{tail_log}")
-                    raise FFmpegError(f"FFmpeg processing failed: {tail_log}")
-                    
-                if not os.path.exists(abs_output_path):
-                    raise FFmpegError("Output file missing after FFmpeg run")
-                    
-                logger.info(f"Successfully processed video (no subtitles): {os.path.basename(abs_output_path)}")
-
-            except Exception as e:
-                if isinstance(e, FFmpegError):
-                    raise
-                logger.error(f"FFmpeg execution failed: {str(e)}")
-                raise FFmpegError(f"FFmpeg execution failed: {str(e)}")
+            logger.info("Successfully processed video (no subtitles): %s", os.path.basename(abs_output_path))
 
     # Alias for compatibility
     embed_subtitles = burn_subtitles
\ No newline at end of file
@@ -7,7 +7,6 @@ Handles connection, CRUD operations, and error logging.
 
 import asyncio
 import logging
-import ssl
 from typing import Optional, List
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
@@ -19,6 +18,9 @@ from models.video import VideoMetadata, VideoStatus, VideoCreateRequest, VideoUp
 
 logger = logging.getLogger(__name__)
 
+# Only fetch the fields VideoMetadata reads (plus _id, included by default)
+PROJECTION = {field: 1 for field in VideoMetadata.model_fields}
+
 class MongoDBService:
     """
     Service class for MongoDB operations on video metadata.
@@ -51,10 +53,8 @@ class MongoDBService:
             if "mongodb+srv://" in settings.MONGODB_URL or "mongodb.net" in settings.MONGODB_URL:
                 import certifi
                 
-                ssl_context = ssl.create_default_context(cafile=certifi.where())
-                ssl_context.check_hostname = True
-                ssl_context.verify_mode = ssl.CERT_REQUIRED
-                
+                # The driver builds its TLS context from tlsCAFile (hostname
+                # verification and CERT_REQUIRED are its defaults)
                 connection_options.update({
                     "tls": True,
                     "tlsCAFile": certifi.where(),
@@ -66,13 +66,13 @@ class MongoDBService:
             # Simple ping to verify connection
             await cls._client.admin.command('ping')
             
-            logger.info(f"Connected to MongoDB: {settings.MONGODB_DATABASE}")
+            logger.info("Connected to MongoDB: %s", settings.MONGODB_DATABASE)
             
             # Create indexes
             await cls._create_indexes()
             
         except Exception as e:
-            logger.error(f"Failed to connect to MongoDB. Ensure the service is running. Error: {e}")
+            logger.error("Failed to connect to MongoDB. Ensure the service is running. Error: %s", e)
             raise
     
     @classmethod
@@ -89,17 +89,21 @@ class MongoDBService:
     async def _create_indexes(cls):
         """
         Create necessary indexes for the collection.
-        Optimizes queries by filename, status, creation date, and source_video_id.
+        Optimizes queries by filename, status (sorted by creation date), creation date, and source_video_id.
         """
         if cls._database is None:
             return
 
         collection = cls._database[settings.MONGODB_COLLECTION]
         
-        await collection.create_index("filename")
-        await collection.create_index("status")
-        await collection.create_index("created_at")
-        await collection.create_index("source_video_id")  # Index for cross-database lookup
+        # Independent builds: send them concurrently
+        await asyncio.gather(
+            collection.create_index("filename"),
+            # Serves list_videos' status filter and its newest-first sort without an in-memory sort
+            collection.create_index([("status", 1), ("created_at", -1)]),
+            collection.create_index("created_at"),  # Unfiltered listing (walked in reverse)
+            collection.create_index("source_video_id")  # Index for cross-database lookup
+        )
         
         logger.info("Database indexes created successfully")
     
@@ -129,15 +133,13 @@ class MongoDBService:
             
             result = await collection.insert_one(video_dict)
             
-            # Fetch the created document to return it complete
-            created_video = await collection.find_one({"_id": result.inserted_id})
-            
-            logger.info(f"Video metadata created: {video_data.filename} (ID: {result.inserted_id})")
+            logger.info("Video metadata created: %s (ID: %s)", video_data.filename, result.inserted_id)
             
-            return VideoMetadata(**created_video)
+            # The inserted document is already complete (insert_one set its _id)
+            return VideoMetadata(**video_dict)
             
         except PyMongoError as e:
-            logger.error(f"Failed to create video metadata: {e}")
+            logger.error("Failed to create video metadata: %s", e)
             raise
     
     @classmethod
@@ -166,18 +168,19 @@ class MongoDBService:
             result = await collection.find_one_and_update(
                 {"_id": ObjectId(video_id)},
                 {"$set": update_dict},
+                projection=PROJECTION,
                 return_document=True
             )
             
             if result:
-                logger.info(f"Video metadata updated: ID {video_id}")
+                logger.info("Video metadata updated: ID %s", video_id)
                 return VideoMetadata(**result)
             else:
-                logger.warning(f"Video not found for update: ID {video_id}")
+                logger.warning("Video not found for update: ID %s", video_id)
                 return None
                 
         except PyMongoError as e:
-            logger.error(f"Failed to update video metadata: {e}")
+            logger.error("Failed to update video metadata: %s", e)
             raise
     
     @classmethod
@@ -194,20 +197,18 @@ class MongoDBService:
         try:
             collection = cls._database[settings.MONGODB_COLLECTION]
             
-            try:
-                oid = ObjectId(video_id)
-            except Exception:
+            if not ObjectId.is_valid(video_id):
                 # Invalid ID format returns None immediately
                 return None
 
-            video = await collection.find_one({"_id": oid})
+            video = await collection.find_one({"_id": ObjectId(video_id)}, PROJECTION)
             
             if video:
                 return VideoMetadata(**video)
             return None
             
         except PyMongoError as e:
-            logger.error(f"Failed to retrieve video metadata: {e}")
+            logger.error("Failed to retrieve video metadata: %s", e)
             raise
     
     @classmethod
@@ -224,14 +225,14 @@ class MongoDBService:
         try:
             collection = cls._database[settings.MONGODB_COLLECTION]
             
-            video = await collection.find_one({"filename": filename})
+            video = await collection.find_one({"filename": filename}, PROJECTION)
             
             if video:
                 return VideoMetadata(**video)
             return None
             
         except PyMongoError as e:
-            logger.error(f"Failed to retrieve video by filename: {e}")
+            logger.error("Failed to retrieve video by filename: %s", e)
             raise
     
     @classmethod
@@ -248,15 +249,15 @@ class MongoDBService:
         try:
             collection = cls._database[settings.MONGODB_COLLECTION]
             
-            video = await collection.find_one({"source_video_id": source_video_id})
+            video = await collection.find_one({"source_video_id": source_video_id}, PROJECTION)
             
             if video:
-                logger.info(f"Found video with source_video_id: {source_video_id}")
+                logger.info("Found video with source_video_id: %s", source_video_id)
                 return VideoMetadata(**video)
             return None
             
         except PyMongoError as e:
-            logger.error(f"Failed to retrieve video by source_video_id: {e}")
+            logger.error("Failed to retrieve video by source_video_id: %s", e)
             raise
             raise
     
@@ -279,13 +280,13 @@ class MongoDBService:
             if status:
                 query["status"] = status
             
-            cursor = collection.find(query).sort("created_at", -1).limit(limit)
+            cursor = collection.find(query, PROJECTION).sort("created_at", -1).limit(limit)
             videos = await cursor.to_list(length=limit)
             
             return [VideoMetadata(**video) for video in videos]
             
         except PyMongoError as e:
-            logger.error(f"Failed to list videos: {e}")
+            logger.error("Failed to list videos: %s", e)
             raise
     
     @classmethod
@@ -302,20 +303,18 @@ class MongoDBService:
         try:
             collection = cls._database[settings.MONGODB_COLLECTION]
             
-            try:
-                oid = ObjectId(video_id)
-            except Exception:
+            if not ObjectId.is_valid(video_id):
                 return False
 
-            result = await collection.delete_one({"_id": oid})
+            result = await collection.delete_one({"_id": ObjectId(video_id)})
             
             if result.deleted_count > 0:
-                logger.info(f"Video metadata deleted: ID {video_id}")
+                logger.info("Video metadata deleted: ID %s", video_id)
                 return True
             else:
-                logger.warning(f"Video not found for deletion: ID {video_id}")
+                logger.warning("Video not found for deletion: ID %s", video_id)
                 return False
                 
         except PyMongoError as e:
-            logger.error(f"Failed to delete video metadata: {e}")
+            logger.error("Failed to delete video metadata: %s", e)
             raise
\ No newline at end of file
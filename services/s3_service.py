@@ -5,16 +5,67 @@ Amazon S3 service for video file storage.
 Handles upload, download, streaming, and deletion of video files.
 """
 
+import asyncio
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, AsyncGenerator
+from typing import Any, Optional, AsyncGenerator, Dict, List, Tuple
+import aiofiles
 import aioboto3
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Presigned URLs are reused for at most this many seconds (and never past half their lifetime)
+PRESIGNED_URL_CACHE_TTL = 300
+PRESIGNED_URL_CACHE_SIZE = 1024
+
+# Bound on cached HeadObject results, and how long a health-check bucket probe is reused (seconds)
+FILE_INFO_CACHE_SIZE = 10000
+BUCKET_CHECK_CACHE_TTL = 30
+
+# DeleteObjects accepts at most 1000 keys per request
+DELETE_OBJECTS_MAX_KEYS = 1000
+
+# Connection pool shared by concurrent requests on a client, kept alive between
+# requests; fail fast on an unreachable endpoint, but give reads of large parts
+# room to arrive, and let adaptive retries absorb throttling
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+    connect_timeout=2,
+    read_timeout=30,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    s3={"addressing_style": "virtual"}
+)
+
+# Streamed GetObject bodies are read only as fast as the player consumes them, so
+# a paused or backpressured client must not trip the socket read timeout mid-stream
+STREAM_CLIENT_CONFIG = CLIENT_CONFIG.merge(Config(read_timeout=300))
+
+# Multipart settings for uploads: parts are sent concurrently above the threshold
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=settings.S3_MULTIPART_THRESHOLD,
+    multipart_chunksize=settings.S3_MULTIPART_CHUNKSIZE,
+    max_concurrency=settings.S3_MAX_CONCURRENCY,
+    # Read whole parts at once: each read from an async file is a thread hop
+    io_chunksize=settings.S3_MULTIPART_CHUNKSIZE
+)
+
+# SigV4 signing is pure CPU work (HMAC-SHA256); run it off the event loop
+_sign_pool = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 4),
+    thread_name_prefix="s3-sign"
+)
+
 
 class S3Service:
     """
@@ -23,6 +74,16 @@ class S3Service:
     """
     
     _session: Optional[aioboto3.Session] = None
+    _client_cm = None
+    _client = None
+    _stream_client_cm = None
+    _stream_client = None
+    _client_lock = asyncio.Lock()
+    _url_cache: Dict[Tuple[str, int], Tuple[str, float]] = {}
+    _info_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+    _bucket_check: Optional[Tuple[bool, float]] = None
+    _signing_client = None
+    _signing_lock = threading.Lock()
     
     @classmethod
     def _get_session(cls) -> aioboto3.Session:
@@ -44,6 +105,68 @@ class S3Service:
         
         return cls._session
     
+    @classmethod
+    def _get_client_kwargs(cls) -> dict:
+        """Get client kwargs (connection pool and retry configuration)."""
+        return {"config": CLIENT_CONFIG}
+    
+    @classmethod
+    async def _get_client(cls):
+        """
+        Get the shared S3 client, opening it on first use.
+        
+        The client (and its HTTP connection pool) stays open until disconnect(),
+        so requests reuse warm connections instead of a new TLS handshake each.
+        """
+        if cls._client is None:
+            async with cls._client_lock:
+                if cls._client is None:
+                    client_cm = cls._get_session().client("s3", **cls._get_client_kwargs())
+                    cls._client = await client_cm.__aenter__()
+                    cls._client_cm = client_cm
+        return cls._client
+    
+    @classmethod
+    async def _get_stream_client(cls):
+        """
+        Get the S3 client used by stream_file, opening it on first use.
+        
+        Same as _get_client, but with STREAM_CLIENT_CONFIG's longer read timeout
+        (and its own connection pool).
+        """
+        if cls._stream_client is None:
+            async with cls._client_lock:
+                if cls._stream_client is None:
+                    client_cm = cls._get_session().client("s3", config=STREAM_CLIENT_CONFIG)
+                    cls._stream_client = await client_cm.__aenter__()
+                    cls._stream_client_cm = client_cm
+        return cls._stream_client
+    
+    @classmethod
+    def _get_signing_client(cls):
+        """Get or create the synchronous client used only for presigning (thread-safe)."""
+        if cls._signing_client is None:
+            with cls._signing_lock:
+                if cls._signing_client is None:
+                    session_kwargs = {"region_name": settings.AWS_REGION}
+                    if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
+                        session_kwargs["aws_access_key_id"] = settings.AWS_ACCESS_KEY_ID
+                        session_kwargs["aws_secret_access_key"] = settings.AWS_SECRET_ACCESS_KEY
+                    cls._signing_client = boto3.session.Session(**session_kwargs).client("s3")
+        return cls._signing_client
+    
+    @classmethod
+    def _sign(cls, full_key: str, exp_time: int) -> str:
+        """Presign a GetObject URL (runs in the signing thread pool)."""
+        return cls._get_signing_client().generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": settings.S3_BUCKET_NAME,
+                "Key": full_key
+            },
+            ExpiresIn=exp_time
+        )
+    
     @classmethod
     async def initialize(cls):
         """
@@ -51,34 +174,51 @@ class S3Service:
         Creates the bucket if it doesn't exist.
         """
         try:
-            session = cls._get_session()
-            async with session.client("s3") as s3:
-                # Check if bucket exists
-                try:
-                    await s3.head_bucket(Bucket=settings.S3_BUCKET_NAME)
-                    logger.info(f"S3 bucket verified: {settings.S3_BUCKET_NAME}")
-                except ClientError as e:
-                    error_code = e.response.get("Error", {}).get("Code", "")
-                    if error_code == "404":
-                        # Bucket doesn't exist, create it
-                        logger.info(f"Creating S3 bucket: {settings.S3_BUCKET_NAME}")
-                        create_params = {"Bucket": settings.S3_BUCKET_NAME}
-                        
-                        # LocationConstraint is required for non-us-east-1 regions
-                        if settings.AWS_REGION != "us-east-1":
-                            create_params["CreateBucketConfiguration"] = {
-                                "LocationConstraint": settings.AWS_REGION
-                            }
-                        
-                        await s3.create_bucket(**create_params)
-                        logger.info(f"S3 bucket created: {settings.S3_BUCKET_NAME}")
-                    else:
-                        raise
-                        
+            # Building the session loads botocore data files synchronously: keep it off the loop
+            await asyncio.to_thread(cls._get_session)
+            s3 = await cls._get_client()
+            
+            # Check if bucket exists
+            try:
+                await s3.head_bucket(Bucket=settings.S3_BUCKET_NAME)
+                logger.info("S3 bucket verified: %s", settings.S3_BUCKET_NAME)
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "")
+                if error_code == "404":
+                    # Bucket doesn't exist, create it
+                    logger.info("Creating S3 bucket: %s", settings.S3_BUCKET_NAME)
+                    create_params = {"Bucket": settings.S3_BUCKET_NAME}
+                    
+                    # LocationConstraint is required for non-us-east-1 regions
+                    if settings.AWS_REGION != "us-east-1":
+                        create_params["CreateBucketConfiguration"] = {
+                            "LocationConstraint": settings.AWS_REGION
+                        }
+                    
+                    await s3.create_bucket(**create_params)
+                    logger.info("S3 bucket created: %s", settings.S3_BUCKET_NAME)
+                else:
+                    raise
+                    
         except Exception as e:
-            logger.error(f"Failed to initialize S3 service: {e}")
+            logger.error("Failed to initialize S3 service: %s", e)
             raise
     
+    @classmethod
+    async def disconnect(cls):
+        """
+        Close the shared S3 clients and their connection pools.
+        """
+        if cls._client_cm is not None:
+            client_cm = cls._client_cm
+            cls._client_cm = cls._client = None
+            await client_cm.__aexit__(None, None, None)
+        if cls._stream_client_cm is not None:
+            client_cm = cls._stream_client_cm
+            cls._stream_client_cm = cls._stream_client = None
+            await client_cm.__aexit__(None, None, None)
+        logger.info("S3 service disconnected")
+    
     @classmethod
     async def upload_file(
         cls,
@@ -89,6 +229,9 @@ class S3Service:
         """
         Upload a file to S3.
         
+        Files above S3_MULTIPART_THRESHOLD are sent as a multipart upload with
+        up to S3_MAX_CONCURRENCY parts in flight.
+        
         Args:
             local_path: Path to the local file to upload.
             s3_key: S3 object key (path within the bucket).
@@ -101,24 +244,26 @@ class S3Service:
             ClientError: If upload fails.
         """
         try:
-            session = cls._get_session()
+            s3 = await cls._get_client()
             full_key = f"{settings.S3_PREFIX}{s3_key}"
             
-            async with session.client("s3") as s3:
-                with open(local_path, "rb") as file_data:
-                    await s3.upload_fileobj(
-                        file_data,
-                        settings.S3_BUCKET_NAME,
-                        full_key,
-                        ExtraArgs={"ContentType": content_type}
-                    )
+            # Reads run in a thread instead of blocking the event loop
+            async with aiofiles.open(local_path, "rb") as file_data:
+                await s3.upload_fileobj(
+                    file_data,
+                    settings.S3_BUCKET_NAME,
+                    full_key,
+                    ExtraArgs={"ContentType": content_type},
+                    Config=TRANSFER_CONFIG
+                )
             
+            cls._info_cache.pop(full_key, None)
             s3_uri = f"s3://{settings.S3_BUCKET_NAME}/{full_key}"
-            logger.info(f"File uploaded to S3: {s3_uri}")
+            logger.info("File uploaded to S3: %s", s3_uri)
             return s3_uri
             
         except ClientError as e:
-            logger.error(f"Failed to upload file to S3: {e}")
+            logger.error("Failed to upload file to S3: %s", e)
             raise
     
     @classmethod
@@ -137,24 +282,40 @@ class S3Service:
             ClientError: If download fails.
         """
         try:
-            session = cls._get_session()
+            s3 = await cls._get_client()
             full_key = f"{settings.S3_PREFIX}{s3_key}"
             
-            async with session.client("s3") as s3:
-                with open(local_path, "wb") as file_data:
-                    await s3.download_fileobj(
-                        settings.S3_BUCKET_NAME,
-                        full_key,
-                        file_data
-                    )
+            # Writes run in a thread instead of blocking the event loop
+            async with aiofiles.open(local_path, "wb") as file_data:
+                await s3.download_fileobj(
+                    settings.S3_BUCKET_NAME,
+                    full_key,
+                    file_data
+                )
             
-            logger.info(f"File downloaded from S3: {full_key} -> {local_path}")
+            logger.info("File downloaded from S3: %s -> %s", full_key, local_path)
             return local_path
             
         except ClientError as e:
-            logger.error(f"Failed to download file from S3: {e}")
+            logger.error("Failed to download file from S3: %s", e)
             raise
     
+    @classmethod
+    def _get_cached_url(cls, full_key: str, exp_time: int) -> Optional[str]:
+        """Return a previously signed URL if it is still within its reuse window."""
+        entry = cls._url_cache.get((full_key, exp_time))
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+        return None
+    
+    @classmethod
+    def _cache_url(cls, full_key: str, exp_time: int, url: str) -> None:
+        """Remember a signed URL, evicting the oldest entry when the cache is full."""
+        if len(cls._url_cache) >= PRESIGNED_URL_CACHE_SIZE:
+            cls._url_cache.pop(next(iter(cls._url_cache)))
+        reuse_for = min(PRESIGNED_URL_CACHE_TTL, exp_time // 2)
+        cls._url_cache[(full_key, exp_time)] = (url, time.monotonic() + reuse_for)
+    
     @classmethod
     async def get_presigned_url(
         cls,
@@ -172,27 +333,73 @@ class S3Service:
             str: Presigned URL for the file.
         """
         try:
-            session = cls._get_session()
             full_key = f"{settings.S3_PREFIX}{s3_key}"
             exp_time = expiration or settings.S3_PRESIGNED_URL_EXPIRATION
             
-            async with session.client("s3") as s3:
-                url = await s3.generate_presigned_url(
-                    "get_object",
-                    Params={
-                        "Bucket": settings.S3_BUCKET_NAME,
-                        "Key": full_key
-                    },
-                    ExpiresIn=exp_time
-                )
+            url = cls._get_cached_url(full_key, exp_time)
+            if url:
+                return url
             
-            logger.debug(f"Generated presigned URL for: {full_key}")
+            loop = asyncio.get_running_loop()
+            url = await loop.run_in_executor(_sign_pool, cls._sign, full_key, exp_time)
+            
+            cls._cache_url(full_key, exp_time, url)
+            logger.debug("Generated presigned URL for: %s", full_key)
             return url
             
         except ClientError as e:
-            logger.error(f"Failed to generate presigned URL: {e}")
+            logger.error("Failed to generate presigned URL: %s", e)
             raise
     
+    @classmethod
+    async def get_presigned_urls(
+        cls,
+        s3_keys: List[str],
+        expiration: Optional[int] = None
+    ) -> Dict[str, str]:
+        """
+        Generate presigned URLs for several files, signing them in parallel.
+        
+        Args:
+            s3_keys: S3 object keys (without prefix).
+            expiration: URL expiration time in seconds.
+            
+        Returns:
+            Dict[str, str]: Presigned URL per key. Keys that failed to sign are omitted.
+        """
+        exp_time = expiration or settings.S3_PRESIGNED_URL_EXPIRATION
+        urls = {}
+        missing = []
+        
+        for s3_key in dict.fromkeys(s3_keys):
+            url = cls._get_cached_url(f"{settings.S3_PREFIX}{s3_key}", exp_time)
+            if url:
+                urls[s3_key] = url
+            else:
+                missing.append(s3_key)
+        
+        if not missing:
+            return urls
+        
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(_sign_pool, cls._sign, f"{settings.S3_PREFIX}{s3_key}", exp_time)
+                for s3_key in missing
+            ),
+            return_exceptions=True
+        )
+        
+        for s3_key, result in zip(missing, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to generate presigned URL for %s: %s", s3_key, result)
+                continue
+            cls._cache_url(f"{settings.S3_PREFIX}{s3_key}", exp_time, result)
+            urls[s3_key] = result
+        
+        logger.debug("Generated presigned URLs for %s keys", len(missing))
+        return urls
+    
     @classmethod
     async def delete_file(cls, s3_key: str) -> bool:
         """
@@ -205,22 +412,70 @@ class S3Service:
             bool: True if deleted successfully.
         """
         try:
-            session = cls._get_session()
+            s3 = await cls._get_client()
             full_key = f"{settings.S3_PREFIX}{s3_key}"
             
-            async with session.client("s3") as s3:
-                await s3.delete_object(
-                    Bucket=settings.S3_BUCKET_NAME,
-                    Key=full_key
-                )
+            await s3.delete_object(
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=full_key
+            )
             
-            logger.info(f"File deleted from S3: {full_key}")
+            cls._info_cache.pop(full_key, None)
+            logger.info("File deleted from S3: %s", full_key)
             return True
             
         except ClientError as e:
-            logger.error(f"Failed to delete file from S3: {e}")
+            logger.error("Failed to delete file from S3: %s", e)
             raise
     
+    @classmethod
+    async def delete_files(cls, s3_keys: List[str]) -> List[str]:
+        """
+        Delete several files from S3 with DeleteObjects (up to 1000 keys per request).
+        
+        Args:
+            s3_keys: S3 object keys (without prefix).
+            
+        Returns:
+            List[str]: The keys that were deleted; failures are logged and left out.
+        """
+        full_keys = {f"{settings.S3_PREFIX}{s3_key}": s3_key for s3_key in s3_keys}
+        if not full_keys:
+            return []
+        
+        try:
+            s3 = await cls._get_client()
+            batches = list(full_keys)
+            responses = await asyncio.gather(*(
+                s3.delete_objects(
+                    Bucket=settings.S3_BUCKET_NAME,
+                    Delete={
+                        "Objects": [{"Key": full_key} for full_key in batches[i:i + DELETE_OBJECTS_MAX_KEYS]],
+                        "Quiet": True  # Only report errors
+                    }
+                )
+                for i in range(0, len(batches), DELETE_OBJECTS_MAX_KEYS)
+            ))
+            
+        except ClientError as e:
+            logger.error("Failed to delete files from S3: %s", e)
+            raise
+        
+        failed = set()
+        for response in responses:
+            for error in response.get("Errors", []):
+                logger.warning("Failed to delete %s from S3: %s", error.get("Key"), error.get("Message"))
+                failed.add(error.get("Key"))
+        
+        deleted = []
+        for full_key, s3_key in full_keys.items():
+            cls._info_cache.pop(full_key, None)
+            if full_key not in failed:
+                deleted.append(s3_key)
+        
+        logger.info("Files deleted from S3: %s", len(deleted))
+        return deleted
+    
     @classmethod
     async def file_exists(cls, s3_key: str) -> bool:
         """
@@ -233,14 +488,13 @@ class S3Service:
             bool: True if file exists.
         """
         try:
-            session = cls._get_session()
+            s3 = await cls._get_client()
             full_key = f"{settings.S3_PREFIX}{s3_key}"
             
-            async with session.client("s3") as s3:
-                await s3.head_object(
-                    Bucket=settings.S3_BUCKET_NAME,
-                    Key=full_key
-                )
+            await s3.head_object(
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=full_key
+            )
             return True
             
         except ClientError as e:
@@ -249,31 +503,85 @@ class S3Service:
             raise
     
     @classmethod
-    async def get_file_size(cls, s3_key: str) -> Optional[int]:
+    async def get_file_info(cls, s3_key: str) -> Optional[Dict[str, Any]]:
         """
-        Get the size of a file in S3.
+        Get size and validators (ETag, Last-Modified) of a file in S3.
+        
+        Results for existing files are cached for S3_METADATA_CACHE_TTL seconds;
+        uploads and deletes through this service invalidate the entry.
         
         Args:
             s3_key: S3 object key (without prefix).
             
         Returns:
-            Optional[int]: File size in bytes, or None if not found.
+            Optional[Dict[str, Any]]: size, etag and last_modified, or None if not found.
         """
+        full_key = f"{settings.S3_PREFIX}{s3_key}"
+        
+        entry = cls._info_cache.get(full_key)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+        
         try:
-            session = cls._get_session()
-            full_key = f"{settings.S3_PREFIX}{s3_key}"
-            
-            async with session.client("s3") as s3:
-                response = await s3.head_object(
-                    Bucket=settings.S3_BUCKET_NAME,
-                    Key=full_key
-                )
-                return response.get("ContentLength")
+            s3 = await cls._get_client()
+            response = await s3.head_object(
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=full_key
+            )
             
         except ClientError as e:
             if e.response.get("Error", {}).get("Code") == "404":
                 return None
             raise
+        
+        info = {
+            "size": response.get("ContentLength"),
+            "etag": response.get("ETag"),
+            "last_modified": response.get("LastModified")
+        }
+        
+        if settings.S3_METADATA_CACHE_TTL:
+            if len(cls._info_cache) >= FILE_INFO_CACHE_SIZE:
+                cls._info_cache.pop(next(iter(cls._info_cache)))
+            cls._info_cache[full_key] = (info, time.monotonic() + settings.S3_METADATA_CACHE_TTL)
+        
+        return info
+    
+    @classmethod
+    async def check_bucket(cls) -> bool:
+        """
+        Check that the bucket is reachable, caching the answer for BUCKET_CHECK_CACHE_TTL
+        seconds so frequent health checks do not each hit S3.
+        
+        Returns:
+            bool: True if head_bucket succeeded.
+        """
+        if cls._bucket_check and cls._bucket_check[1] > time.monotonic():
+            return cls._bucket_check[0]
+        
+        try:
+            s3 = await cls._get_client()
+            await s3.head_bucket(Bucket=settings.S3_BUCKET_NAME)
+            reachable = True
+        except Exception:
+            reachable = False
+        
+        cls._bucket_check = (reachable, time.monotonic() + BUCKET_CHECK_CACHE_TTL)
+        return reachable
+    
+    @classmethod
+    async def get_file_size(cls, s3_key: str) -> Optional[int]:
+        """
+        Get the size of a file in S3.
+        
+        Args:
+            s3_key: S3 object key (without prefix).
+            
+        Returns:
+            Optional[int]: File size in bytes, or None if not found.
+        """
+        info = await cls.get_file_info(s3_key)
+        return info["size"] if info else None
     
     @classmethod
     async def stream_file(
@@ -294,7 +602,7 @@ class S3Service:
             bytes: Chunks of file data.
         """
         try:
-            session = cls._get_session()
+            s3 = await cls._get_stream_client()
             full_key = f"{settings.S3_PREFIX}{s3_key}"
             
             # Build range header
@@ -302,20 +610,16 @@ class S3Service:
             if end_byte is not None:
                 range_header = f"bytes={start_byte}-{end_byte}"
             
-            async with session.client("s3") as s3:
-                response = await s3.get_object(
-                    Bucket=settings.S3_BUCKET_NAME,
-                    Key=full_key,
-                    Range=range_header
-                )
-                
-                async with response["Body"] as stream:
-                    while True:
-                        chunk = await stream.read(settings.CHUNK_SIZE)
-                        if not chunk:
-                            break
-                        yield chunk
+            response = await s3.get_object(
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=full_key,
+                Range=range_header
+            )
+            
+            async with response["Body"] as stream:
+                async for chunk in stream.iter_chunks(settings.CHUNK_SIZE):
+                    yield chunk
                         
         except ClientError as e:
-            logger.error(f"Failed to stream file from S3: {e}")
+            logger.error("Failed to stream file from S3: %s", e)
             raise
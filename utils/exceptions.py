@@ -29,6 +29,15 @@ class FileProcessingError(ServiceError):
     pass
 
 
+# Status code and message suffix per service error class
+ERROR_MAPPING = {
+    SubtitleServiceError: (502, "subtitle generation failed"),
+    CompressionServiceError: (502, "compression failed"),
+    FFmpegError: (500, "video processing failed"),
+    FileProcessingError: (500, "file operation failed"),
+}
+
+
 def handle_service_error(error: Exception, service_name: str) -> HTTPException:
     """
     Convert service errors to appropriate HTTP exceptions.
@@ -43,22 +52,18 @@ def handle_service_error(error: Exception, service_name: str) -> HTTPException:
     if isinstance(error, HTTPException):
         return error
     
-    error_mapping = {
-        SubtitleServiceError: (502, f"{service_name} subtitle generation failed"),
-        CompressionServiceError: (502, f"{service_name} compression failed"),
-        FFmpegError: (500, f"{service_name} video processing failed"),
-        FileProcessingError: (500, f"{service_name} file operation failed"),
-    }
-    
-    for exc_type, (status_code, message) in error_mapping.items():
-        if isinstance(error, exc_type):
+    # Nearest mapped class in the MRO, so subclasses inherit their base's mapping
+    for exc_type in type(error).__mro__:
+        mapping = ERROR_MAPPING.get(exc_type)
+        if mapping is not None:
+            status_code, message = mapping
             return HTTPException(
                 status_code=status_code,
-                detail=f"{message}: {str(error)}"
+                detail=f"{service_name} {message}: {error}"
             )
     
     # Generic error
     return HTTPException(
         status_code=500,
-        detail=f"{service_name} encountered an unexpected error: {str(error)}"
+        detail=f"{service_name} encountered an unexpected error: {error}"
     )
\ No newline at end of file
@@ -5,10 +5,14 @@ Utility functions for file operations and video processing.
 """
 
 import os
+import asyncio
 import logging
 import subprocess
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Collection, List, Optional, Dict, Union
+
+import aiofiles.os
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -22,14 +26,35 @@ def cleanup_files(file_paths: List[Path]) -> None:
     """
     for file_path in file_paths:
         try:
-            if file_path.exists() and file_path.is_file():
-                file_path.unlink()
-                logger.info(f"Cleaned up file: {file_path}")
+            # One unlink instead of exists() + is_file() + unlink() syscalls
+            file_path.unlink()
+            logger.info("Cleaned up file: %s", file_path)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            logger.warning(f"Failed to delete file {file_path}: {e}")
+            logger.warning("Failed to delete file %s: %s", file_path, e)
 
 
-def validate_file_size(file_path: Path, max_size: int) -> bool:
+async def cleanup_files_async(file_paths: List[Path]) -> None:
+    """
+    Delete temporary files concurrently without blocking the event loop.
+    
+    Args:
+        file_paths: List of file paths to delete
+    """
+    results = await asyncio.gather(
+        *(aiofiles.os.remove(file_path) for file_path in file_paths),
+        return_exceptions=True
+    )
+    
+    for file_path, result in zip(file_paths, results):
+        if result is None:
+            logger.info("Cleaned up file: %s", file_path)
+        elif not isinstance(result, FileNotFoundError):
+            logger.warning("Failed to delete file %s: %s", file_path, result)
+
+
+def validate_file_size(file_path: Union[str, os.PathLike], max_size: int) -> bool:
     """
     Validate that a file does not exceed maximum size.
     
@@ -40,11 +65,11 @@ def validate_file_size(file_path: Path, max_size: int) -> bool:
     Returns:
         True if file is within size limit, False otherwise
     """
-    if not file_path.exists():
+    # One stat instead of exists() + stat()
+    try:
+        return os.stat(file_path).st_size <= max_size
+    except (FileNotFoundError, NotADirectoryError):
         return False
-    
-    file_size = file_path.stat().st_size
-    return file_size <= max_size
 
 
 def get_video_info(video_path: Path) -> Dict[str, Optional[str]]:
@@ -63,65 +88,54 @@ def get_video_info(video_path: Path) -> Dict[str, Optional[str]]:
     }
     
     try:
-        # Get duration
-        duration_cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path)
-        ]
-        
-        duration_result = subprocess.run(
-            duration_cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if duration_result.returncode == 0 and duration_result.stdout.strip():
-            info["duration"] = float(duration_result.stdout.strip())
-        
-        # Get resolution
-        resolution_cmd = [
+        # Duration and resolution from a single ffprobe run
+        probe_cmd = [
             "ffprobe",
             "-v", "error",
             "-select_streams", "v:0",
-            "-show_entries", "stream=width,height",
-            "-of", "csv=s=x:p=0",
+            "-show_entries", "format=duration:stream=width,height",
+            "-of", "json",
             str(video_path)
         ]
         
-        resolution_result = subprocess.run(
-            resolution_cmd,
+        probe_result = subprocess.run(
+            probe_cmd,
             capture_output=True,
-            text=True,
             timeout=30
         )
         
-        if resolution_result.returncode == 0 and resolution_result.stdout.strip():
-            info["resolution"] = resolution_result.stdout.strip()
+        if probe_result.returncode == 0:
+            data = orjson.loads(probe_result.stdout)
+            
+            duration = data.get("format", {}).get("duration")
+            if duration:
+                info["duration"] = float(duration)
+            
+            streams = data.get("streams")
+            if streams and streams[0].get("width") and streams[0].get("height"):
+                info["resolution"] = f"{streams[0]['width']}x{streams[0]['height']}"
         
-        logger.info(f"Extracted video info: {info}")
+        logger.info("Extracted video info: %s", info)
         
     except subprocess.TimeoutExpired:
         logger.error("ffprobe command timed out")
     except Exception as e:
-        logger.error(f"Failed to extract video info: {e}")
+        logger.error("Failed to extract video info: %s", e)
     
     return info
 
 
-def validate_video_extension(filename: str, allowed_extensions: List[str]) -> bool:
+def validate_video_extension(filename: str, allowed_extensions: Collection[str]) -> bool:
     """
     Validate that a filename has an allowed extension.
     
     Args:
         filename: Name of file to validate
-        allowed_extensions: List of allowed extensions (e.g., ['.mp4', '.avi'])
+        allowed_extensions: Allowed lowercase extensions (e.g., {'.mp4', '.avi'});
+            pass a set such as settings.ALLOWED_EXTENSIONS for constant-time lookups
         
     Returns:
         True if extension is allowed, False otherwise
     """
-    file_ext = Path(filename).suffix.lower()
+    file_ext = os.path.splitext(filename)[1].lower()
     return file_ext in allowed_extensions
\ No newline at end of file
@@ -10,7 +10,8 @@ from typing import Optional
 
 def setup_logging(
     log_level: str = "INFO",
-    log_file: Optional[str] = None
+    log_file: Optional[str] = None,
+    debug: bool = False
 ) -> None:
     """
     Configure application-wide logging.
@@ -18,6 +19,7 @@ def setup_logging(
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path for log output
+        debug: Log the caller's [filename:lineno] to the file
     """
     
     # Create formatters
@@ -44,7 +46,7 @@ def setup_logging(
         log_path.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(detailed_formatter)
+        file_handler.setFormatter(detailed_formatter if debug else simple_formatter)
         handlers.append(file_handler)
     
     # Configure root logger